@@ -3,13 +3,19 @@ class MockMetadata:
 
     def __init__(self, state):
         self._state = state
+        self._cached_version = -1
+        self._cached_keyspaces = None
 
     @property
     def keyspaces(self):
-        return {
-            name: MockKeyspaceMetadata(name, info)
-            for name, info in self._state.keyspaces.items()
-        }
+        version = self._state._schema_version
+        if version != self._cached_version:
+            self._cached_keyspaces = {
+                name: MockKeyspaceMetadata(name, info)
+                for name, info in self._state.keyspaces.items()
+            }
+            self._cached_version = version
+        return self._cached_keyspaces
 
     def get_keyspace(self, name):
         return self.keyspaces.get(name)
@@ -21,6 +27,15 @@ class MockMetadata:
 class MockKeyspaceMetadata:
     """Represents keyspace metadata."""
 
+    __slots__ = (
+        "durable_writes",
+        "name",
+        "replication_strategy",
+        "tables",
+        "user_types",
+        "views",
+    )
+
     def __init__(self, name, info):
         self.name = name
         self.durable_writes = info.get("durable_writes", True)
@@ -29,7 +44,8 @@ class MockKeyspaceMetadata:
             table_name: MockTableMetadata(name, table_name, table_info)
             for table_name, table_info in info.get("tables", {}).items()
         }
-        self.user_types = info.get("types", {})
+        # Reference the keyspace's own types mapping rather than copying it.
+        self.user_types = info.get("types") or {}
         self.views = {
             view_name: MockMaterializedViewMetadata(name, view_name, view_info)
             for view_name, view_info in info.get("views", {}).items()
@@ -56,6 +72,18 @@ def _resolve_primary_key_info(primary_key):
 class MockTableMetadata:
     """Represents table metadata."""
 
+    __slots__ = (
+        "clustering_key",
+        "clustering_orders",
+        "columns",
+        "indexes",
+        "keyspace",
+        "name",
+        "options",
+        "partition_key",
+        "primary_key",
+    )
+
     def __init__(self, keyspace_name, table_name, table_info):
         self.keyspace = keyspace_name
         self.name = table_name
@@ -64,18 +92,16 @@ class MockTableMetadata:
             column_name: MockColumnMetadata(column_name, column_type)
             for column_name, column_type in schema.items()
         }
-        partition_names, clustering_names, primary_names = (
-            _resolve_primary_key_info(table_info.get("primary_key", []))
+        partition_names, _, primary_names = _resolve_primary_key_info(
+            table_info.get("primary_key", [])
         )
-        self.partition_key = [
-            self.columns[col] for col in partition_names if col in self.columns
-        ]
-        self.clustering_key = [
-            self.columns[col] for col in clustering_names if col in self.columns
-        ]
+        columns = self.columns
         self.primary_key = [
-            self.columns[col] for col in primary_names if col in self.columns
+            columns[col] for col in primary_names if col in columns
         ]
+        partition_count = sum(1 for col in partition_names if col in columns)
+        self.partition_key = self.primary_key[:partition_count]
+        self.clustering_key = self.primary_key[partition_count:]
         self.clustering_orders = table_info.get("clustering_orders", {})
         for column_name, column in self.columns.items():
             if column_name in self.clustering_orders:
@@ -98,6 +124,16 @@ class MockTableMetadata:
 class MockMaterializedViewMetadata:
     """Represents materialized view metadata."""
 
+    __slots__ = (
+        "base_keyspace",
+        "base_table",
+        "keyspace",
+        "name",
+        "options",
+        "primary_key",
+        "where_clause",
+    )
+
     def __init__(self, keyspace_name, view_name, view_info):
         self.keyspace = keyspace_name
         self.name = view_name
@@ -111,6 +147,8 @@ class MockMaterializedViewMetadata:
 class MockColumnMetadata:
     """Represents column metadata."""
 
+    __slots__ = ("clustering_order", "cql_type", "name", "typestring")
+
     def __init__(self, name, cql_type):
         self.name = name
         self.cql_type = cql_type
@@ -1,49 +1,61 @@
-from functools import wraps
-from unittest.mock import patch
+import logging
+from functools import partialmethod, wraps
+from unittest.mock import MagicMock, patch
 
 from .metadata import MockMetadata
 from .session import MockSession
 from .state import ScyllaState, _set_global_state
 
+logger = logging.getLogger(__name__)
 
 CONNECTION_FACTORY_PATH = "cassandra.connection.Connection.factory"
 
 
+def _mock_cluster_connect(cluster_self, keyspace=None, *args, state, **kwargs):
+    """Mock Cluster.connect with signature flexibility."""
+
+    if keyspace is None and args:
+        keyspace = args[0]
+
+    logger.debug("MockCluster connect called for keyspace: %s", keyspace)
+    session = MockSession(
+        keyspace=keyspace,
+        state=state,
+        cluster=cluster_self,
+    )
+    cluster_self.metadata = MockMetadata(state)
+    session.metadata = cluster_self.metadata
+    return session
+
+
 class MockScyllaDB:
     def __init__(self):
-        self.patcher = patch(CONNECTION_FACTORY_PATH)
+        # Each mock owns its stand-in, so nested mocks keep separate histories.
+        self.connection_factory = MagicMock(name="Connection.factory")
+        self.patcher = patch(
+            CONNECTION_FACTORY_PATH, new=self.connection_factory
+        )
         self.state = ScyllaState()
+        self._cluster_connect = partialmethod(
+            _mock_cluster_connect, state=self.state
+        )
 
     def __enter__(self):
         self.state.reset()
         _set_global_state(self.state)
 
+        self.connection_factory.reset_mock()
         self.patcher.start()
 
-        def mock_cluster_connect(cluster_self, keyspace=None, *args, **kwargs):
-            """Mock Cluster.connect with signature flexibility."""
-
-            if keyspace is None and args:
-                keyspace = args[0]
-
-            print(f"MockCluster connect called for keyspace: {keyspace}")
-            session = MockSession(
-                keyspace=keyspace,
-                state=self.state,
-                cluster=cluster_self,
-            )
-            cluster_self.metadata = MockMetadata(self.state)
-            session.metadata = cluster_self.metadata
-            return session
-
         self.cluster_connect_patcher = patch(
-            "cassandra.cluster.Cluster.connect", new=mock_cluster_connect
+            "cassandra.cluster.Cluster.connect", new=self._cluster_connect
         )
         self.cluster_connect_patcher.start()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.patcher.stop()
         self.cluster_connect_patcher.stop()
+        self.state.release_table_caches()
         _set_global_state(None)
 
 
@@ -1,8 +1,11 @@
+import logging
+
 from cassandra import InvalidRequest
 from cassandra.query import BatchStatement as DriverBatchStatement
+from cassandra.query import SimpleStatement as DriverSimpleStatement
 from cassandra.query import Statement as DriverStatement
 
-from mockylla.parser import handle_query
+from mockylla.parser import parse
 from mockylla.results import ResultSet
 
 from .statements import (
@@ -14,10 +17,43 @@ from .statements import (
     _normalise_placeholders,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def _normalise_bound(query, _parameters):
+    return query._internal_query, query.values
+
+
+def _normalise_prepared(query, parameters):
+    return query._internal_query, _coerce_parameters(
+        parameters, query.param_order, query._param_names
+    )
+
+
+def _normalise_driver_statement(query, parameters):
+    return _normalise_placeholders(query.query_string), parameters
+
+
+def _normalise_plain(query, parameters):
+    return query, parameters
+
+
+_BATCH_TYPES = (DriverBatchStatement, MockBatchStatement)
+
+_NORMALISE_DISPATCH = {
+    str: _normalise_plain,
+    MockBoundStatement: _normalise_bound,
+    MockPreparedStatement: _normalise_prepared,
+    DriverSimpleStatement: _normalise_driver_statement,
+    DriverStatement: _normalise_driver_statement,
+}
+
 
 class MockResponseFuture:
     """Simple future-like wrapper for execute_async."""
 
+    __slots__ = ("_cancelled", "_result")
+
     def __init__(self, result):
         self._result = result
         self._cancelled = False
@@ -25,17 +61,25 @@ class MockResponseFuture:
     def result(self, timeout=None):  # noqa: ARG002 (parity with driver)
         return self._result
 
-    def add_callbacks(self, callback=None, errback=None):
+    def add_callbacks(
+        self,
+        callback=None,
+        errback=None,
+        callback_args=(),
+        callback_kwargs=None,
+        errback_args=(),
+        errback_kwargs=None,
+    ):
         if callback:
-            callback(self._result)
+            callback(self._result, *callback_args, **(callback_kwargs or {}))
         return self
 
-    def add_callback(self, callback):
+    def add_callback(self, callback, *args, **kwargs):
         if callback:
-            callback(self._result)
+            callback(self._result, *args, **kwargs)
         return self
 
-    def add_errback(self, errback):
+    def add_errback(self, errback, *args, **kwargs):
         return self
 
     def exception(self, timeout=None):  # noqa: ARG002
@@ -57,7 +101,7 @@ class MockCluster:
 
     def shutdown(self):
         """Maintain parity with driver Cluster.shutdown()."""
-        print("MockCluster shutdown called")
+        logger.debug("MockCluster shutdown called")
 
 
 class MockSession:
@@ -72,8 +116,7 @@ class MockSession:
         self.row_factory = None
         self.default_timeout = None
         self._is_shutdown = False
-        self._prepared_statements = []
-        print(f"Set keyspace to: {keyspace}")
+        logger.debug("Set keyspace to: %s", keyspace)
 
     def set_keyspace(self, keyspace):
         """Sets the current keyspace for the session."""
@@ -81,7 +124,7 @@ class MockSession:
         if keyspace not in self.state.keyspaces:
             raise InvalidRequest(f"Keyspace '{keyspace}' does not exist")
         self.keyspace = keyspace
-        print(f"Set keyspace to: {keyspace}")
+        logger.debug("Set keyspace to: %s", keyspace)
 
     def execute(
         self,
@@ -94,7 +137,7 @@ class MockSession:
 
         self._ensure_open()
 
-        if isinstance(query, (DriverBatchStatement, MockBatchStatement)):
+        if type(query) is not str and isinstance(query, _BATCH_TYPES):
             return self._execute_batch_statement(
                 query,
                 execution_profile=execution_profile,
@@ -106,9 +149,10 @@ class MockSession:
             query, parameters
         )
 
-        print(
-            f"MockSession execute called with query: {query_string}; "
-            f"execution_profile={execution_profile}"
+        logger.debug(
+            "MockSession execute called with query: %s; execution_profile=%s",
+            query_string,
+            execution_profile,
         )
 
         return self._run_query(
@@ -127,21 +171,36 @@ class MockSession:
     ):
         """Asynchronous execute analogue returning a future-like object."""
 
-        result = self.execute(
-            query,
-            parameters=parameters,
-            execution_profile=execution_profile,
-            **kwargs,
+        self._ensure_open()
+
+        if type(query) is not str and isinstance(query, _BATCH_TYPES):
+            result = self._execute_batch_statement(
+                query,
+                execution_profile=execution_profile,
+                parameters=parameters,
+                **kwargs,
+            )
+            return MockResponseFuture(result)
+
+        query_string, bound_values = self._normalise_query_input(
+            query, parameters
+        )
+        return MockResponseFuture(
+            self._run_query(
+                query_string,
+                bound_values,
+                execution_profile=execution_profile,
+                **kwargs,
+            )
         )
-        return MockResponseFuture(result)
 
     def prepare(self, query):
         """Prepare a CQL statement for later execution."""
 
         self._ensure_open()
-        prepared = MockPreparedStatement(query, session=self)
-        self._prepared_statements.append(prepared)
-        return prepared
+        # Parsing is cached per query text; each call still gets its own
+        # handle so per-statement settings don't leak between callers.
+        return MockPreparedStatement(query, session=self)
 
     def shutdown(self):
         """Release session resources and prevent further queries."""
@@ -149,7 +208,7 @@ class MockSession:
         if self._is_shutdown:
             return
         self._is_shutdown = True
-        print("MockSession shutdown called")
+        logger.debug("MockSession shutdown called")
 
     close = shutdown
 
@@ -164,18 +223,19 @@ class MockSession:
             )
 
     def _normalise_query_input(self, query, parameters):
+        handler = _NORMALISE_DISPATCH.get(type(query))
+        if handler is not None:
+            return handler(query, parameters)
         if isinstance(query, MockBoundStatement):
-            return query._internal_query, query.values
+            return _normalise_bound(query, parameters)
         if isinstance(query, MockPreparedStatement):
-            return query._internal_query, _coerce_parameters(
-                parameters, query.param_order
-            )
+            return _normalise_prepared(query, parameters)
         if isinstance(query, DriverStatement):
-            return _normalise_placeholders(query.query_string), parameters
+            return _normalise_driver_statement(query, parameters)
         return query, parameters
 
     def _run_query(self, query, parameters, **kwargs):
-        return handle_query(query, self, self.state, parameters=parameters)
+        return parse(query).execute(self, self.state, parameters)
 
     def _execute_batch_statement(
         self, batch, *, execution_profile=None, parameters=None, **kwargs
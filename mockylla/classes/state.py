@@ -1,6 +1,10 @@
 from cassandra import InvalidRequest
 
-from mockylla.parser.utils import purge_expired_rows
+from mockylla.parser.utils import (
+    expose_table,
+    forget_table_caches,
+    purge_expired_rows,
+)
 
 
 def _resolve_primary_key_components(table_info):
@@ -21,46 +25,64 @@ def _resolve_primary_key_components(table_info):
     return partition_keys, clustering_keys, combined
 
 
+def _initial_keyspaces():
+    """Build the keyspaces present in a freshly started cluster."""
+    return {
+        "system": {
+            "tables": {
+                "local": {
+                    "schema": {
+                        "key": "text",
+                        "rpc_address": "inet",
+                        "data_center": "text",
+                        "rack": "text",
+                    },
+                    "data": [
+                        {
+                            "key": "local",
+                            "rpc_address": "127.0.0.1",
+                            "data_center": "datacenter1",
+                            "rack": "rack1",
+                        }
+                    ],
+                    "indexes": [],
+                }
+            },
+            "types": {},
+            "views": {},
+            "replication": {
+                "class": "SimpleStrategy",
+                "replication_factor": "1",
+            },
+            "durable_writes": True,
+        }
+    }
+
+
 class ScyllaState:
     """Manages the in-memory state of the mock ScyllaDB."""
 
     def __init__(self):
-        self.keyspaces = {
-            "system": {
-                "tables": {
-                    "local": {
-                        "schema": {
-                            "key": "text",
-                            "rpc_address": "inet",
-                            "data_center": "text",
-                            "rack": "text",
-                        },
-                        "data": [
-                            {
-                                "key": "local",
-                                "rpc_address": "127.0.0.1",
-                                "data_center": "datacenter1",
-                                "rack": "rack1",
-                            }
-                        ],
-                        "indexes": [],
-                    }
-                },
-                "types": {},
-                "views": {},
-                "replication": {
-                    "class": "SimpleStrategy",
-                    "replication_factor": "1",
-                },
-                "durable_writes": True,
-            }
-        }
-        self._ensure_system_schema_structure()
-        self.update_system_schema()
+        self._schema_version = 0
+        self._schema_cache = {}
+        self._table_index = {}
+        self.keyspaces = {}
+        self.reset()
 
     def reset(self):
         """Resets the state to a clean slate."""
-        self.__init__()
+        self.release_table_caches()
+        self.keyspaces = _initial_keyspaces()
+        self._ensure_system_schema_structure()
+        self.bump_schema_version()
+
+    def release_table_caches(self):
+        """Forget the private per-table caches kept for this state's tables."""
+        forget_table_caches(
+            table_info
+            for keyspace_info in self.keyspaces.values()
+            for table_info in keyspace_info.get("tables", {}).values()
+        )
 
     def _ensure_system_schema_structure(self):
         if "system_schema" not in self.keyspaces:
@@ -135,9 +157,25 @@ class ScyllaState:
                 "durable_writes": True,
             }
 
+    def bump_schema_version(self):
+        """Record a schema change so cached schema rows get rebuilt."""
+        self._schema_version += 1
+        self._schema_dirty = True
+        self._schema_cache.clear()
+        self._table_index.clear()
+
+    def maybe_refresh_system_schema(self):
+        """Rebuild ``system_schema`` rows only if the schema changed."""
+        if self._schema_dirty:
+            self.update_system_schema()
+
     def update_system_schema(self):
         self._ensure_system_schema_structure()
 
+        if self._schema_cache.get("version") != self._schema_version:
+            self._schema_cache["rows"] = self._collect_system_schema_rows()
+            self._schema_cache["version"] = self._schema_version
+
         system_schema_tables = self.keyspaces["system_schema"]["tables"]
 
         (
@@ -146,13 +184,14 @@ class ScyllaState:
             columns_rows,
             indexes_rows,
             views_rows,
-        ) = self._collect_system_schema_rows()
+        ) = self._schema_cache["rows"]
 
         system_schema_tables["keyspaces"]["data"] = keyspaces_rows
         system_schema_tables["tables"]["data"] = tables_rows
         system_schema_tables["columns"]["data"] = columns_rows
         system_schema_tables["indexes"]["data"] = indexes_rows
         system_schema_tables["views"]["data"] = views_rows
+        self._schema_dirty = False
 
     def _collect_system_schema_rows(self):
         keyspaces_rows = []
@@ -184,15 +223,16 @@ class ScyllaState:
         )
 
     def _build_keyspace_row(self, keyspace_name, keyspace_info):
-        replication = {
-            str(k): str(v)
-            for k, v in keyspace_info.get("replication", {}).items()
-        }
+        replication = keyspace_info.get("replication")
         if not replication:
             replication = {
                 "class": "SimpleStrategy",
                 "replication_factor": "1",
             }
+        elif not all(
+            type(k) is str and type(v) is str for k, v in replication.items()
+        ):
+            replication = {str(k): str(v) for k, v in replication.items()}
 
         return {
             "keyspace_name": keyspace_name,
@@ -226,6 +266,8 @@ class ScyllaState:
         partition_keys, clustering_keys, _ = _resolve_primary_key_components(
             table_info
         )
+        partition_keys = frozenset(partition_keys)
+        clustering_keys = frozenset(clustering_keys)
         clustering_orders = table_info.get("clustering_orders", {})
 
         column_rows = []
@@ -297,44 +339,78 @@ def _set_global_state(state):
 
 
 def get_keyspaces():
-    """Returns a dictionary of the created keyspaces in the mock state."""
+    """Returns a dictionary of the created keyspaces in the mock state.
+
+    Rows reached through this mapping are for reading; change them via
+    :func:`get_table_rows` so primary key lookups notice the change.
+    """
     if _global_state is None:
         raise InvalidRequest("Mock is not active.")
+    _global_state.maybe_refresh_system_schema()
     return _global_state.keyspaces
 
 
-def get_tables(keyspace_name):
-    """Returns a dictionary of the created tables for a given keyspace."""
+def _expose_tables(keyspace_info):
+    """Mark every table of a keyspace handed to the caller as exposed."""
+    for table_info in keyspace_info.get("tables", {}).values():
+        expose_table(table_info)
+
+
+def _get_keyspace(keyspace_name):
     if _global_state is None:
         raise InvalidRequest("Mock is not active.")
-    if keyspace_name not in _global_state.keyspaces:
+    keyspace = _global_state.keyspaces.get(keyspace_name)
+    if keyspace is None:
         raise InvalidRequest(
             f"Keyspace '{keyspace_name}' does not exist in mock state."
         )
-    return _global_state.keyspaces[keyspace_name]["tables"]
+    return keyspace
+
+
+def get_tables(keyspace_name):
+    """Returns a dictionary of the created tables for a given keyspace.
+
+    The returned tables' rows may be changed by the caller, so primary key
+    lookups and TTL purges on them scan rows from now on, until the table is
+    dropped or the mock is reset.
+    """
+    keyspace_info = _get_keyspace(keyspace_name)
+    if keyspace_name == "system_schema":
+        _global_state.maybe_refresh_system_schema()
+    _expose_tables(keyspace_info)
+    return keyspace_info["tables"]
 
 
 def get_table_rows(keyspace_name, table_name):
-    """Returns a list of rows for a given table in a keyspace."""
-    tables = get_tables(keyspace_name)
-    if table_name not in tables:
-        raise InvalidRequest(
-            f"Table '{table_name}' does not exist in keyspace '{keyspace_name}'."
-        )
-    table_info = tables[table_name]
+    """Returns a list of rows for a given table in a keyspace.
+
+    The rows may be changed by the caller, so primary key lookups and TTL
+    purges on this table scan rows from now on, until the table is dropped
+    or the mock is reset.
+    """
+    if keyspace_name == "system_schema" and _global_state is not None:
+        _global_state.maybe_refresh_system_schema()
+    key = (keyspace_name, table_name)
+    table_info = (
+        _global_state._table_index.get(key)
+        if _global_state is not None
+        else None
+    )
+    if table_info is None:
+        table_info = _get_keyspace(keyspace_name)["tables"].get(table_name)
+        if table_info is None:
+            raise InvalidRequest(
+                f"Table '{table_name}' does not exist in keyspace '{keyspace_name}'."
+            )
+        _global_state._table_index[key] = table_info
     purge_expired_rows(table_info)
+    expose_table(table_info)
     return table_info["data"]
 
 
 def get_types(keyspace_name):
     """Returns a dictionary of the created types for a given keyspace."""
-    if _global_state is None:
-        raise InvalidRequest("Mock is not active.")
-    if keyspace_name not in _global_state.keyspaces:
-        raise InvalidRequest(
-            f"Keyspace '{keyspace_name}' does not exist in mock state."
-        )
-    return _global_state.keyspaces[keyspace_name].get("types", {})
+    return _get_keyspace(keyspace_name).get("types", {})
 
 
 __all__ = [
@@ -1,16 +1,41 @@
 import re
 from collections.abc import Mapping, Sequence
+from functools import lru_cache
 
 from cassandra.query import BatchStatement as DriverBatchStatement
 
+_INSERT_RE = re.compile(
+    r"INSERT\s+INTO\s+[^\(]+\(([^\)]+)\)\s+VALUES\s*\(([^\)]+)\)",
+    re.IGNORECASE,
+)
+_UPDATE_RE = re.compile(r"SET\s+(.+?)\s+WHERE\s+(.+)", re.IGNORECASE)
+_SELECT_WHERE_RE = re.compile(
+    r"WHERE\s+(.+?)(?:\s+ORDER\b|\s+LIMIT\b|\s+ALLOW\b|$)",
+    re.IGNORECASE,
+)
+_DELETE_RE = re.compile(r"DELETE\s+.*?FROM\s+.+?WHERE\s+(.+)", re.IGNORECASE)
+_AND_SPLIT_RE = re.compile(r"\s+AND\s+", re.IGNORECASE)
+_LEADING_IDENT_RE = re.compile(r"\s*(\w+)")
+
 
 class MockPreparedStatement:
     """Minimal prepared statement representation."""
 
+    __slots__ = (
+        "__dict__",
+        "_internal_query",
+        "_original_query",
+        "_param_names",
+        "_param_order",
+        "keyspace",
+        "session",
+    )
+
     def __init__(self, query_string, session):
         self._original_query = query_string
-        self._internal_query = _normalise_placeholders(query_string)
-        self._param_order = _extract_parameter_order(query_string)
+        self._internal_query, self._param_order = _parse_prepared(query_string)
+        # A column may appear in several placeholders; checks need the set.
+        self._param_names = frozenset(self._param_order)
         self.keyspace = session.keyspace
         self.session = session
 
@@ -29,11 +54,23 @@ class MockPreparedStatement:
 class MockBoundStatement:
     """Represents a prepared statement bound with positional values."""
 
+    __slots__ = (
+        "__dict__",
+        "_internal_query",
+        "_param_names",
+        "_param_order",
+        "_values",
+        "prepared_statement",
+    )
+
     def __init__(self, prepared_statement, values=None):
         self.prepared_statement = prepared_statement
         self._internal_query = prepared_statement._internal_query
         self._param_order = prepared_statement.param_order
-        self._values = _coerce_parameters(values, self._param_order)
+        self._param_names = prepared_statement._param_names
+        self._values = _coerce_parameters(
+            values, self._param_order, self._param_names
+        )
 
     @property
     def values(self):
@@ -47,6 +84,8 @@ class MockBoundStatement:
 class MockBatchStatement:
     """Lightweight batch statement for grouping CQL commands."""
 
+    __slots__ = ("__dict__", "_statements", "batch_type", "consistency_level")
+
     def __init__(self, batch_type="LOGGED"):
         self.batch_type = batch_type
         self.consistency_level = None
@@ -56,8 +95,9 @@ class MockBatchStatement:
         self._statements.append((statement, parameters))
 
     def add_all(self, statements):
-        for statement, parameters in statements:
-            self.add(statement, parameters)
+        self._statements.extend(
+            (statement, parameters) for statement, parameters in statements
+        )
 
     def clear(self):
         self._statements.clear()
@@ -67,30 +107,34 @@ class MockBatchStatement:
         return list(self._statements)
 
 
+@lru_cache(maxsize=1024)
+def _parse_prepared(query):
+    """Return the internal query string and parameter order for a query."""
+
+    return (
+        _normalise_placeholders(query),
+        tuple(_extract_parameter_order(query)),
+    )
+
+
 def _normalise_placeholders(query):
     """Replace question-mark placeholders with %s for internal parsing."""
 
-    return re.sub(r"\?", "%s", query)
+    return query.replace("?", "%s")
 
 
 def _extract_parameter_order(query):
     query_clean = " ".join(query.strip().split())
     order = []
 
-    insert_match = re.search(
-        r"INSERT\s+INTO\s+[^\(]+\(([^\)]+)\)\s+VALUES\s*\(([^\)]+)\)",
-        query_clean,
-        flags=re.IGNORECASE,
-    )
+    insert_match = _INSERT_RE.search(query_clean)
     if insert_match:
         columns = [col.strip() for col in insert_match.group(1).split(",")]
         placeholders = insert_match.group(2).count("?")
         if placeholders == len(columns):
             return columns
 
-    update_match = re.search(
-        r"SET\s+(.+?)\s+WHERE\s+(.+)", query_clean, flags=re.IGNORECASE
-    )
+    update_match = _UPDATE_RE.search(query_clean)
     if update_match:
         set_part, where_part = update_match.groups()
         for assignment in set_part.split(","):
@@ -100,20 +144,12 @@ def _extract_parameter_order(query):
         order.extend(_extract_where_parameters(where_part))
         return order
 
-    select_match = re.search(
-        r"WHERE\s+(.+?)(?:\s+ORDER\b|\s+LIMIT\b|\s+ALLOW\b|$)",
-        query_clean,
-        flags=re.IGNORECASE,
-    )
+    select_match = _SELECT_WHERE_RE.search(query_clean)
     if select_match:
         order.extend(_extract_where_parameters(select_match.group(1)))
         return order
 
-    delete_match = re.search(
-        r"DELETE\s+.*?FROM\s+.+?WHERE\s+(.+)",
-        query_clean,
-        flags=re.IGNORECASE,
-    )
+    delete_match = _DELETE_RE.search(query_clean)
     if delete_match:
         order.extend(_extract_where_parameters(delete_match.group(1)))
         return order
@@ -123,55 +159,83 @@ def _extract_parameter_order(query):
 
 def _extract_where_parameters(where_clause):
     order = []
-    for condition in re.split(r"\s+AND\s+", where_clause, flags=re.IGNORECASE):
+    if "?" not in where_clause:
+        return order
+    for condition in _AND_SPLIT_RE.split(where_clause):
         if "?" not in condition:
             continue
-        match = re.match(r"\s*(\w+)", condition)
+        match = _LEADING_IDENT_RE.match(condition)
         if match:
             order.append(match.group(1))
     return order
 
 
-def _coerce_parameters(values, param_order=None):
+def _coerce_parameters(values, param_order=None, param_names=None):
+    value_type = type(values)
+    if value_type is tuple:
+        return values
+    if value_type is list:
+        return tuple(values)
+    if value_type is dict:
+        return _order_mapping_parameters(values, param_order, param_names)
     if values is None:
         return None
     if isinstance(values, MockBoundStatement):
         return values.values
     if isinstance(values, Mapping):
-        if not param_order:
-            return tuple(values[key] for key in values.keys())
-        missing = [name for name in param_order if name not in values]
-        if missing:
-            missing_str = ", ".join(missing)
-            raise ValueError(
-                f"Missing parameters for prepared statement: {missing_str}"
-            )
-        ordered = tuple(values[name] for name in param_order)
-        extras = set(values.keys()) - set(param_order)
+        return _order_mapping_parameters(values, param_order, param_names)
+    if isinstance(values, Sequence) and not isinstance(values, (str, bytes)):
+        return tuple(values)
+    return (values,)
+
+
+def _order_mapping_parameters(values, param_order, param_names=None):
+    """Order named parameters by ``param_order`` in a single pass."""
+
+    if not param_order:
+        return tuple(values.values())
+
+    ordered = []
+    missing = []
+    for name in param_order:
+        try:
+            ordered.append(values[name])
+        except KeyError:
+            missing.append(name)
+    if missing:
+        missing_str = ", ".join(missing)
+        raise ValueError(
+            f"Missing parameters for prepared statement: {missing_str}"
+        )
+
+    if param_names is None:
+        param_names = frozenset(param_order)
+    if len(values) != len(param_names):
+        extras = [key for key in values if key not in param_names]
         if extras:
             extra_str = ", ".join(sorted(extras))
             raise ValueError(
                 f"Unexpected parameters for prepared statement: {extra_str}"
             )
-        return ordered
-    if isinstance(values, Sequence) and not isinstance(values, (str, bytes)):
-        return tuple(values)
-    return (values,)
+    return tuple(ordered)
 
 
 def _iter_batch_items(batch):
+    """Return ``(statement, parameters)`` pairs for a batch statement."""
+
     if isinstance(batch, MockBatchStatement):
-        for statement, params in batch.statements_and_parameters:
-            yield statement, params
-        return
+        return batch._statements
 
     if isinstance(batch, DriverBatchStatement):
-        entries = getattr(batch, "_statements_and_parameters", [])
-        for _, statement, params in entries:
-            if isinstance(statement, MockBoundStatement):
-                yield statement, statement.values
-            else:
-                yield statement, params or None
+        entries = getattr(batch, "_statements_and_parameters", None) or ()
+        return [
+            (statement, statement.values)
+            if isinstance(statement, MockBoundStatement)
+            else (statement, params or None)
+            for _, statement, params in entries
+        ]
+
+    return []
 
 
 __all__ = [
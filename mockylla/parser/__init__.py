@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 
 from mockylla.results import ResultSet
 from mockylla.parser.alter import handle_alter_table, handle_alter_table_with
@@ -25,261 +26,264 @@ from mockylla.parser.update import handle_update
 from mockylla.parser.type import handle_create_type
 
 
+_FIRST_KEYWORD_RE = re.compile(r"(\w+)")
+
+_USE_RE = re.compile(r"^\s*USE\s+(\w+)\s*;?\s*$", re.IGNORECASE)
+
+_BATCH_RE = re.compile(
+    r"^\s*BEGIN\s+BATCH\s+(.*?)\s+APPLY\s+BATCH\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_CREATE_KEYSPACE_RE = re.compile(
+    r"^\s*CREATE\s+KEYSPACE\s+(?:IF NOT EXISTS\s+)?(\w+)\s+WITH\s+REPLICATION\s*=\s*({.*})\s*;?\s*$",
+    re.IGNORECASE,
+)
+
+_CREATE_TABLE_RE = re.compile(
+    r"^\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?([\w\.]+)\s*\((.*?)\)\s*(?:WITH\s+(.*))?\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_CREATE_TYPE_RE = re.compile(
+    r"^\s*CREATE\s+TYPE\s+(?:IF NOT EXISTS\s+)?([\w\.]+)\s*\((.*)\)\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_CREATE_MATERIALIZED_VIEW_RE = re.compile(
+    (
+        r"^\s*CREATE\s+MATERIALIZED\s+VIEW\s+(?:IF\s+NOT\s+EXISTS\s+)?([\w\.]+)\s+AS\s+SELECT\s+"
+        r"(.*?)\s+FROM\s+([\w\.]+)\s+WHERE\s+(.*?)\s+PRIMARY\s+KEY\s*\((.*?)\)"
+        r"\s*(?:WITH\s+(.*))?\s*;?\s*$"
+    ),
+    re.IGNORECASE | re.DOTALL,
+)
+
+_INSERT_RE = re.compile(
+    r"^\s*INSERT\s+INTO\s+([\w\.]+)\s*\(([\w\s,]+)\)\s+VALUES\s*\((.*)\)\s*(?:USING\s+(.*?))?(?:\s+IF\s+(.*))?\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_SELECT_RE = re.compile(
+    (
+        r"^\s*SELECT\s+(.*?)\s+FROM\s+([\w\.]+)"
+        r"(?:\s+WHERE\s+(.*?))?"
+        r"(?:\s+GROUP\s+BY\s+(.*?))?"
+        r"(?:\s+HAVING\s+(.*?))?"
+        r"(?:\s+ORDER BY\s+(.*?))?"
+        r"(?:\s+LIMIT\s+([^\s;]+))?"
+        r"(?:\s+ALLOW\s+FILTERING)?"
+        r"\s*;?\s*$"
+    ),
+    re.IGNORECASE | re.DOTALL,
+)
+
+_UPDATE_RE = re.compile(
+    r"^\s*UPDATE\s+([\w\.]+)(?:\s+USING\s+(.*?))?\s+SET\s+(.*)\s+WHERE\s+(.*?)(?:\s+IF\s+(.*))?\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_DELETE_RE = re.compile(
+    r"^\s*DELETE\s+FROM\s+([\w\.]+)\s+WHERE\s+(.*?)(?:\s+IF\s+(.*))?\s*;?\s*$",
+    re.IGNORECASE,
+)
+
+_DROP_KEYSPACE_RE = re.compile(
+    r"^\s*DROP\s+KEYSPACE\s+(?:IF\s+EXISTS\s+)?(\w+)\s*;?\s*$",
+    re.IGNORECASE,
+)
+
+_DROP_TABLE_RE = re.compile(
+    r"^\s*DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?([\w\.]+)\s*;?\s*$",
+    re.IGNORECASE,
+)
+
+_DROP_MATERIALIZED_VIEW_RE = re.compile(
+    r"^\s*DROP\s+MATERIALIZED\s+VIEW\s+(?:IF\s+EXISTS\s+)?([\w\.]+)\s*;?\s*$",
+    re.IGNORECASE,
+)
+
+_TRUNCATE_RE = re.compile(
+    r"^\s*TRUNCATE\s+(?:TABLE\s+)?([\w\.]+)\s*;?\s*$",
+    re.IGNORECASE,
+)
+
+_ALTER_TABLE_RE = re.compile(
+    r"^\s*ALTER\s+TABLE\s+([\w\.]+)\s+ADD\s+([\w\s,]+)\s+([\w\s,]+)\s*;?\s*$",
+    re.IGNORECASE,
+)
+
+_ALTER_TABLE_WITH_RE = re.compile(
+    r"^\s*ALTER\s+TABLE\s+([\w\.]+)\s+WITH\s+(.*)\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_CREATE_INDEX_RE = re.compile(
+    r"^\s*CREATE\s+(?:CUSTOM\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:([\w]+)\s+)?ON\s+([\w\.]+)\s*\(([^\)]+)\)\s*;?\s*$",
+    re.IGNORECASE,
+)
+
+_DROP_INDEX_RE = re.compile(
+    r"^\s*DROP\s+INDEX\s+(?:IF\s+EXISTS\s+)?([\w\.]+)\s*;?\s*$",
+    re.IGNORECASE,
+)
+
+
+class CompiledQuery:
+    """A query string resolved to its handler and regex match."""
+
+    __slots__ = ("handler", "match", "query")
+
+    def __init__(self, query, match=None, handler=None):
+        self.query = query
+        self.match = match
+        self.handler = handler
+
+    def execute(self, session, state, parameters=None):
+        if self.handler is None:
+            return f"Error: Unsupported query: {self.query}"
+        return self.handler(self.match, session, state, parameters)
+
+
+@lru_cache(maxsize=4096)
+def parse(query):
+    """Resolve a CQL query string to a reusable :class:`CompiledQuery`."""
+    query = query.strip()
+
+    keyword = _FIRST_KEYWORD_RE.match(query)
+    candidates = (
+        _STATEMENTS_BY_KEYWORD.get(keyword.group(1).upper(), ())
+        if keyword
+        else ()
+    )
+    for pattern, handler in candidates:
+        match = pattern.match(query)
+        if match:
+            return CompiledQuery(query, match, handler)
+
+    return CompiledQuery(query)
+
+
 def handle_query(query, session, state, parameters=None):
     """
     Parses and handles a CQL query.
     """
-    query = query.strip()
+    return parse(query).execute(session, state, parameters)
+
 
-    handlers = [
-        _handle_use,
-        _handle_batch,
-        _handle_create_keyspace,
-        _handle_create_table,
-        _handle_create_type,
-        _handle_create_materialized_view,
-        _handle_insert,
-        _handle_select,
-        _handle_update,
-        _handle_delete,
-        _handle_drop_keyspace,
-        _handle_drop_table,
-        _handle_drop_materialized_view,
-        _handle_truncate_table,
-        _handle_alter_table,
-        _handle_alter_table_with,
-        _handle_create_index,
-        _handle_drop_index,
-    ]
-
-    for handler in handlers:
-        result = handler(query, session, state, parameters)
-        if result is not None:
-            return result
-
-    return f"Error: Unsupported query: {query}"
-
-
-def _handle_use(query, session, _state, _parameters):
-    match = re.match(r"^\s*USE\s+(\w+)\s*;?\s*$", query, re.IGNORECASE)
-    if not match:
-        return None
+def _handle_use(match, session, _state, _parameters):
     session.set_keyspace(match.group(1))
     return ResultSet([])
 
 
-def _handle_batch(query, session, state, parameters):
-    match = re.match(
-        r"^\s*BEGIN\s+BATCH\s+(.*?)\s+APPLY\s+BATCH\s*;?\s*$",
-        query,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not match:
-        return None
+def _handle_batch(match, session, state, parameters):
     handle_batch(match, session, state, parameters=parameters)
     return ResultSet([])
 
 
-def _handle_create_keyspace(query, _session, state, _parameters):
-    match = re.match(
-        r"^\s*CREATE\s+KEYSPACE\s+(?:IF NOT EXISTS\s+)?(\w+)\s+WITH\s+REPLICATION\s*=\s*({.*})\s*;?\s*$",
-        query,
-        re.IGNORECASE,
-    )
-    if not match:
-        return None
+def _handle_create_keyspace(match, _session, state, _parameters):
     handle_create_keyspace(match, state)
     return ResultSet([])
 
 
-def _handle_create_table(query, session, state, _parameters):
-    match = re.match(
-        r"^\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?([\w\.]+)\s*\((.*?)\)\s*(?:WITH\s+(.*))?\s*;?\s*$",
-        query,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not match:
-        return None
+def _handle_create_table(match, session, state, _parameters):
     handle_create_table(match, session, state)
     return ResultSet([])
 
 
-def _handle_create_type(query, session, state, _parameters):
-    match = re.match(
-        r"^\s*CREATE\s+TYPE\s+(?:IF NOT EXISTS\s+)?([\w\.]+)\s*\((.*)\)\s*;?\s*$",
-        query,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not match:
-        return None
+def _handle_create_type(match, session, state, _parameters):
     handle_create_type(match, session, state)
     return ResultSet([])
 
 
-def _handle_create_materialized_view(query, session, state, _parameters):
-    match = re.match(
-        (
-            r"^\s*CREATE\s+MATERIALIZED\s+VIEW\s+(?:IF\s+NOT\s+EXISTS\s+)?([\w\.]+)\s+AS\s+SELECT\s+"
-            r"(.*?)\s+FROM\s+([\w\.]+)\s+WHERE\s+(.*?)\s+PRIMARY\s+KEY\s*\((.*?)\)"
-            r"\s*(?:WITH\s+(.*))?\s*;?\s*$"
-        ),
-        query,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not match:
-        return None
+def _handle_create_materialized_view(match, session, state, _parameters):
     handle_create_materialized_view(match, session, state)
     return ResultSet([])
 
 
-def _handle_insert(query, session, state, parameters):
-    match = re.match(
-        r"^\s*INSERT\s+INTO\s+([\w\.]+)\s*\(([\w\s,]+)\)\s+VALUES\s*\((.*)\)\s*(?:USING\s+(.*?))?(?:\s+IF\s+(.*))?\s*;?\s*$",
-        query,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not match:
-        return None
+def _handle_insert(match, session, state, parameters):
     result = handle_insert_into(match, session, state, parameters=parameters)
     return ResultSet(result)
 
 
-def _handle_select(query, session, state, parameters):
-    match = re.match(
-        (
-            r"^\s*SELECT\s+(.*?)\s+FROM\s+([\w\.]+)"
-            r"(?:\s+WHERE\s+(.*?))?"
-            r"(?:\s+GROUP\s+BY\s+(.*?))?"
-            r"(?:\s+HAVING\s+(.*?))?"
-            r"(?:\s+ORDER BY\s+(.*?))?"
-            r"(?:\s+LIMIT\s+([^\s;]+))?"
-            r"(?:\s+ALLOW\s+FILTERING)?"
-            r"\s*;?\s*$"
-        ),
-        query,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not match:
-        return None
+def _handle_select(match, session, state, parameters):
     rows = handle_select_from(match, session, state, parameters=parameters)
     return ResultSet(rows)
 
 
-def _handle_update(query, session, state, parameters):
-    match = re.match(
-        r"^\s*UPDATE\s+([\w\.]+)(?:\s+USING\s+(.*?))?\s+SET\s+(.*)\s+WHERE\s+(.*?)(?:\s+IF\s+(.*))?\s*;?\s*$",
-        query,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not match:
-        return None
+def _handle_update(match, session, state, parameters):
     result = handle_update(match, session, state, parameters=parameters)
     return ResultSet(result)
 
 
-def _handle_delete(query, session, state, parameters):
-    match = re.match(
-        r"^\s*DELETE\s+FROM\s+([\w\.]+)\s+WHERE\s+(.*?)(?:\s+IF\s+(.*))?\s*;?\s*$",
-        query,
-        re.IGNORECASE,
-    )
-    if not match:
-        return None
+def _handle_delete(match, session, state, parameters):
     result = handle_delete_from(match, session, state, parameters=parameters)
     return ResultSet(result)
 
 
-def _handle_drop_keyspace(query, _session, state, _parameters):
-    match = re.match(
-        r"^\s*DROP\s+KEYSPACE\s+(?:IF\s+EXISTS\s+)?(\w+)\s*;?\s*$",
-        query,
-        re.IGNORECASE,
-    )
-    if not match:
-        return None
+def _handle_drop_keyspace(match, _session, state, _parameters):
     handle_drop_keyspace(match, state)
     return ResultSet([])
 
 
-def _handle_drop_table(query, session, state, _parameters):
-    match = re.match(
-        r"^\s*DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?([\w\.]+)\s*;?\s*$",
-        query,
-        re.IGNORECASE,
-    )
-    if not match:
-        return None
+def _handle_drop_table(match, session, state, _parameters):
     handle_drop_table(match, session, state)
     return ResultSet([])
 
 
-def _handle_drop_materialized_view(query, session, state, _parameters):
-    match = re.match(
-        r"^\s*DROP\s+MATERIALIZED\s+VIEW\s+(?:IF\s+EXISTS\s+)?([\w\.]+)\s*;?\s*$",
-        query,
-        re.IGNORECASE,
-    )
-    if not match:
-        return None
+def _handle_drop_materialized_view(match, session, state, _parameters):
     handle_drop_materialized_view(match, session, state)
     return ResultSet([])
 
 
-def _handle_truncate_table(query, session, state, _parameters):
-    match = re.match(
-        r"^\s*TRUNCATE\s+(?:TABLE\s+)?([\w\.]+)\s*;?\s*$",
-        query,
-        re.IGNORECASE,
-    )
-    if not match:
-        return None
+def _handle_truncate_table(match, session, state, _parameters):
     handle_truncate_table(match, session, state)
     return ResultSet([])
 
 
-def _handle_alter_table(query, session, state, _parameters):
-    match = re.match(
-        r"^\s*ALTER\s+TABLE\s+([\w\.]+)\s+ADD\s+([\w\s,]+)\s+([\w\s,]+)\s*;?\s*$",
-        query,
-        re.IGNORECASE,
-    )
-    if not match:
-        return None
+def _handle_alter_table(match, session, state, _parameters):
     handle_alter_table(match, session, state)
     return ResultSet([])
 
 
-def _handle_alter_table_with(query, session, state, _parameters):
-    match = re.match(
-        r"^\s*ALTER\s+TABLE\s+([\w\.]+)\s+WITH\s+(.*)\s*;?\s*$",
-        query,
-        re.IGNORECASE | re.DOTALL,
-    )
-    if not match:
-        return None
+def _handle_alter_table_with(match, session, state, _parameters):
     handle_alter_table_with(match, session, state)
     return ResultSet([])
 
 
-def _handle_create_index(query, session, state, _parameters):
-    match = re.match(
-        r"^\s*CREATE\s+(?:CUSTOM\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(?:([\w]+)\s+)?ON\s+([\w\.]+)\s*\(([^\)]+)\)\s*;?\s*$",
-        query,
-        re.IGNORECASE,
-    )
-    if not match:
-        return None
+def _handle_create_index(match, session, state, _parameters):
     handle_create_index(match, session, state)
     return ResultSet([])
 
 
-def _handle_drop_index(query, session, state, _parameters):
-    match = re.match(
-        r"^\s*DROP\s+INDEX\s+(?:IF\s+EXISTS\s+)?([\w\.]+)\s*;?\s*$",
-        query,
-        re.IGNORECASE,
-    )
-    if not match:
-        return None
+def _handle_drop_index(match, session, state, _parameters):
     handle_drop_index(match, session, state)
     return ResultSet([])
+
+
+_STATEMENTS_BY_KEYWORD = {
+    "USE": ((_USE_RE, _handle_use),),
+    "BEGIN": ((_BATCH_RE, _handle_batch),),
+    "CREATE": (
+        (_CREATE_KEYSPACE_RE, _handle_create_keyspace),
+        (_CREATE_TABLE_RE, _handle_create_table),
+        (_CREATE_TYPE_RE, _handle_create_type),
+        (_CREATE_MATERIALIZED_VIEW_RE, _handle_create_materialized_view),
+        (_CREATE_INDEX_RE, _handle_create_index),
+    ),
+    "INSERT": ((_INSERT_RE, _handle_insert),),
+    "SELECT": ((_SELECT_RE, _handle_select),),
+    "UPDATE": ((_UPDATE_RE, _handle_update),),
+    "DELETE": ((_DELETE_RE, _handle_delete),),
+    "DROP": (
+        (_DROP_KEYSPACE_RE, _handle_drop_keyspace),
+        (_DROP_TABLE_RE, _handle_drop_table),
+        (_DROP_MATERIALIZED_VIEW_RE, _handle_drop_materialized_view),
+        (_DROP_INDEX_RE, _handle_drop_index),
+    ),
+    "TRUNCATE": ((_TRUNCATE_RE, _handle_truncate_table),),
+    "ALTER": (
+        (_ALTER_TABLE_RE, _handle_alter_table),
+        (_ALTER_TABLE_WITH_RE, _handle_alter_table_with),
+    ),
+}
@@ -1,8 +1,12 @@
+import logging
+
 from cassandra import InvalidRequest
 from cassandra.protocol import SyntaxException
 
 from mockylla.parser.utils import parse_with_options, get_table
 
+logger = logging.getLogger(__name__)
+
 
 def handle_alter_table(match, session, state):
     """
@@ -32,12 +36,15 @@ def handle_alter_table(match, session, state):
     state.keyspaces[keyspace_name]["tables"][table_name]["schema"][
         new_column_name
     ] = new_column_type
-    print(
-        f"Altered table '{table_name}' in keyspace '{keyspace_name}': "
-        f"added column '{new_column_name} {new_column_type}'"
+    logger.debug(
+        "Altered table '%s' in keyspace '%s': added column '%s %s'",
+        table_name,
+        keyspace_name,
+        new_column_name,
+        new_column_type,
     )
 
-    state.update_system_schema()
+    state.bump_schema_version()
     return []
 
 
@@ -52,9 +59,12 @@ def handle_alter_table_with(match, session, state):
     existing_options = table_info.setdefault("options", {})
     existing_options.update(new_options)
 
-    print(
-        f"Altered table '{table_name}' in keyspace '{keyspace_name}' options: {new_options}"
+    logger.debug(
+        "Altered table '%s' in keyspace '%s' options: %s",
+        table_name,
+        keyspace_name,
+        new_options,
     )
 
-    state.update_system_schema()
+    state.bump_schema_version()
     return []
@@ -4,42 +4,60 @@ from mockylla.parser.insert import handle_insert_into
 from mockylla.parser.update import handle_update
 from mockylla.parser.delete import handle_delete_from
 
+_BATCH_INSERT_RE = re.compile(
+    r"^\s*INSERT\s+INTO\s+([\w\.]+)\s*\(([\w\s,]+)\)\s+VALUES\s*\((.*)\)\s*(?:USING\s+(.*?))?\s*(IF\s+NOT\s+EXISTS)?\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_BATCH_UPDATE_RE = re.compile(
+    r"^\s*UPDATE\s+([\w\.]+)(?:\s+USING\s+(.*?))?\s+SET\s+(.*)\s+WHERE\s+(.*?)\s*(IF\s+EXISTS)?\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_BATCH_DELETE_RE = re.compile(
+    r"^\s*DELETE\s+FROM\s+([\w\.]+)\s+WHERE\s+(.*?)\s*(IF EXISTS)?\s*;?\s*$",
+    re.IGNORECASE,
+)
+
+
+# One inner statement: everything up to the next ';' outside a quoted string.
+_BATCH_STATEMENT_RE = re.compile(r"(?:[^;']|'[^']*(?:'|$))+")
+
+
+def _run_insert(match, session, state, parameters):
+    handle_insert_into(match, session, state, parameters=parameters)
+
+
+def _run_update(match, session, state, _parameters):
+    handle_update(match, session, state)
+
+
+def _run_delete(match, session, state, parameters):
+    handle_delete_from(match, session, state, parameters=parameters)
+
+
+_BATCH_STATEMENTS = {
+    "INSERT": (_BATCH_INSERT_RE, _run_insert),
+    "UPDATE": (_BATCH_UPDATE_RE, _run_update),
+    "DELETE": (_BATCH_DELETE_RE, _run_delete),
+}
+
 
 def handle_batch(batch_match, session, state, parameters=None):
     """
     Handles a BATCH query by parsing and executing each inner query.
     """
-    inner_queries_str = batch_match.group(1).strip()
-    queries = [q.strip() for q in inner_queries_str.split(";") if q.strip()]
-
-    for query in queries:
-        insert_match = re.match(
-            r"^\s*INSERT\s+INTO\s+([\w\.]+)\s*\(([\w\s,]+)\)\s+VALUES\s*\((.*)\)\s*(?:USING\s+(.*?))?\s*(IF\s+NOT\s+EXISTS)?\s*;?\s*$",
-            query,
-            re.IGNORECASE | re.DOTALL,
-        )
-        if insert_match:
-            handle_insert_into(
-                insert_match, session, state, parameters=parameters
-            )
-            continue
+    inner_queries_str = batch_match.group(1)
 
-        update_match = re.match(
-            r"^\s*UPDATE\s+([\w\.]+)(?:\s+USING\s+(.*?))?\s+SET\s+(.*)\s+WHERE\s+(.*?)\s*(IF\s+EXISTS)?\s*;?\s*$",
-            query,
-            re.IGNORECASE | re.DOTALL,
-        )
-        if update_match:
-            handle_update(update_match, session, state)
+    for statement in _BATCH_STATEMENT_RE.finditer(inner_queries_str):
+        query = statement.group(0).strip()
+        if not query:
             continue
 
-        delete_match = re.match(
-            r"^\s*DELETE\s+FROM\s+([\w\.]+)\s+WHERE\s+(.*?)\s*(IF EXISTS)?\s*;?\s*$",
-            query,
-            re.IGNORECASE,
-        )
-        if delete_match:
-            handle_delete_from(
-                delete_match, session, state, parameters=parameters
-            )
+        entry = _BATCH_STATEMENTS.get(query.split(None, 1)[0].upper())
+        if entry is None:
             continue
+        pattern, run = entry
+        match = pattern.match(query)
+        if match:
+            run(match, session, state, parameters)
@@ -1,29 +1,52 @@
 import ast
+import logging
 import re
+import sys
 
 from cassandra import InvalidRequest
 from typing import Tuple
 
+from mockylla.parser.utils import build_primary_key_info
 
-def _split_top_level(value):
-    """Split a comma separated string while respecting nested parentheses."""
+logger = logging.getLogger(__name__)
+
+_PK_CLAUSE_RE = re.compile(r"PRIMARY\s+KEY\s*\(", re.IGNORECASE)
+_INLINE_PK_RE = re.compile(r"\s+PRIMARY\s+KEY", re.IGNORECASE)
+_CLUSTERING_ORDER_RE = re.compile(
+    r"^CLUSTERING\s+ORDER\s+BY\s*\((.*)\)$", re.IGNORECASE
+)
+_WITH_AND_RE = re.compile(r"\s+AND\s+", re.IGNORECASE)
+_REPLICATION_ITEM_RE = re.compile(
+    r"""(['"])(.*?)\1\s*:\s*(?:(['"])(.*?)\3|([^\s,}]+))"""
+)
+_PARENS_RE = re.compile(r"[()]")
+_PAREN_DELIMITERS_RE = re.compile(r"[(),]")
+_ANGLE_DELIMITERS_RE = re.compile(r"[<>,]")
+
+
+def _split_top_level(value, delimiters=_PAREN_DELIMITERS_RE):
+    """Split a comma separated string while respecting nested brackets.
+
+    Only delimiter positions are visited, so the loop runs once per bracket or
+    comma rather than once per character.
+    """
 
     parts = []
-    current = ""
+    start = 0
     depth = 0
 
-    for char in value:
-        if char == "(":
+    for match in delimiters.finditer(value):
+        char = match.group()
+        if char == ",":
+            if depth == 0:
+                parts.append(value[start : match.start()].strip())
+                start = match.end()
+        elif char in "(<":
             depth += 1
-        elif char == ")":
+        else:
             depth -= 1
-        elif char == "," and depth == 0:
-            parts.append(current.strip())
-            current = ""
-            continue
-        current += char
 
-    parts.append(current.strip())
+    parts.append(value[start:].strip())
     return [part for part in parts if part]
 
 
@@ -31,27 +54,11 @@ def _parse_column_defs(columns_str):
     """
     Parses a string of CQL column definitions, respecting < > for collection types.
     """
-    defs = []
-    current_def = ""
-    level = 0
-
-    for char in columns_str:
-        if char == "<":
-            level += 1
-        elif char == ">":
-            level -= 1
-        elif char == "," and level == 0:
-            defs.append(current_def.strip())
-            current_def = ""
-            continue
-        current_def += char
-
-    defs.append(current_def.strip())
-    return [d for d in defs if d]
+    return _split_top_level(columns_str, _ANGLE_DELIMITERS_RE)
 
 
 def handle_create_keyspace(create_keyspace_match, state):
-    keyspace_name = create_keyspace_match.group(1)
+    keyspace_name = sys.intern(create_keyspace_match.group(1))
     replication_str = create_keyspace_match.group(2)
     if keyspace_name in state.keyspaces:
         raise InvalidRequest(f"Keyspace '{keyspace_name}' already exists")
@@ -65,8 +72,8 @@ def handle_create_keyspace(create_keyspace_match, state):
         "replication": replication,
         "durable_writes": True,
     }
-    print(f"Created keyspace: {keyspace_name}")
-    state.update_system_schema()
+    logger.debug("Created keyspace: %s", keyspace_name)
+    state.bump_schema_version()
     return []
 
 
@@ -91,36 +98,27 @@ def _determine_depth_and_position(
     columns_str: str, paren_start: int
 ) -> Tuple[int, int]:
     depth = 0
-    idx = paren_start
-    while idx < len(columns_str):
-        if columns_str[idx] == "(":
+    for match in _PARENS_RE.finditer(columns_str, paren_start):
+        if match.group() == "(":
             depth += 1
-        elif columns_str[idx] == ")":
+        else:
             depth -= 1
             if depth == 0:
-                break
-        idx += 1
+                return depth, match.start()
 
-    return depth, idx
+    return depth, len(columns_str)
 
 
 def _extract_primary_key_components(columns_str):
     partition_keys = []
     clustering_keys = []
-    pk_start = None
-    paren_start = None
-    for match in re.finditer(r"PRIMARY\s+KEY", columns_str, re.IGNORECASE):
-        idx = match.end()
-        while idx < len(columns_str) and columns_str[idx].isspace():
-            idx += 1
-        if idx < len(columns_str) and columns_str[idx] == "(":
-            pk_start = match.start()
-            paren_start = idx
-            break
-
-    if pk_start is None or paren_start is None:
+    match = _PK_CLAUSE_RE.search(columns_str)
+    if match is None:
         return columns_str, partition_keys, clustering_keys
 
+    pk_start = match.start()
+    paren_start = match.end() - 1
+
     depth, idx = _determine_depth_and_position(columns_str, paren_start)
 
     if depth != 0:
@@ -134,23 +132,21 @@ def _extract_primary_key_components(columns_str):
 
 
 def _parse_columns(columns_str):
-    column_defs = _parse_column_defs(columns_str)
-    columns = []
+    """Build the schema and inline primary keys in a single pass."""
+    schema = {}
     inline_primary_keys = []
 
-    for column_def in column_defs:
+    for column_def in _parse_column_defs(columns_str):
         parts = column_def.split(None, 1)
         if len(parts) != 2:
             continue
         name, type_ = parts
-        if "PRIMARY KEY" in type_.upper():
+        name = sys.intern(name)
+        cleaned_type, inline_pk = _INLINE_PK_RE.subn("", type_)
+        if inline_pk:
             inline_primary_keys.append(name)
-        cleaned_type = re.sub(
-            r"\s+PRIMARY\s+KEY", "", type_, flags=re.IGNORECASE
-        ).strip()
-        columns.append((name, cleaned_type))
+        schema[name] = cleaned_type.strip()
 
-    schema = {name: type_ for name, type_ in columns if name}
     return schema, inline_primary_keys
 
 
@@ -171,6 +167,7 @@ def handle_create_table(create_table_match, session, state):
     keyspace_name, table_name = _determine_target_table(
         table_name_full, session
     )
+    table_name = sys.intern(table_name)
     _ensure_table_can_be_created(keyspace_name, table_name, state)
 
     columns_str, partition_keys, clustering_keys = (
@@ -183,11 +180,7 @@ def handle_create_table(create_table_match, session, state):
     if not partition_keys and inline_primary_keys:
         partition_keys = inline_primary_keys
 
-    primary_key_info = {
-        "partition": partition_keys,
-        "clustering": clustering_keys,
-        "all": partition_keys + clustering_keys,
-    }
+    primary_key_info = build_primary_key_info(partition_keys, clustering_keys)
 
     state.keyspaces[keyspace_name]["tables"][table_name] = {
         "schema": schema,
@@ -197,10 +190,13 @@ def handle_create_table(create_table_match, session, state):
         "options": options,
         "clustering_orders": clustering_orders,
     }
-    print(
-        f"Created table '{table_name}' in keyspace '{keyspace_name}' with schema: {schema}"
+    logger.debug(
+        "Created table '%s' in keyspace '%s' with schema: %s",
+        table_name,
+        keyspace_name,
+        schema,
     )
-    state.update_system_schema()
+    state.bump_schema_version()
     return []
 
 
@@ -232,7 +228,7 @@ def _parse_primary_key(pk_definition):
 def _extract_clustering_orders(options_str):
     """Extract CLUSTERING ORDER BY clause from a WITH options string."""
 
-    parts = re.split(r"\s+AND\s+", options_str.strip(), flags=re.IGNORECASE)
+    parts = _WITH_AND_RE.split(options_str.strip())
     remaining_parts = []
     clustering_orders = {}
 
@@ -241,10 +237,7 @@ def _extract_clustering_orders(options_str):
         if not cleaned:
             continue
 
-        match = re.match(
-            r"(?i)^CLUSTERING\s+ORDER\s+BY\s*\((.*)\)$",
-            cleaned,
-        )
+        match = _CLUSTERING_ORDER_RE.match(cleaned)
         if match:
             clustering_orders = _parse_clustering_order(match.group(1))
         else:
@@ -269,6 +262,13 @@ def _parse_clustering_order(order_clause):
 
 
 def _parse_replication(replication_str):
+    items = _REPLICATION_ITEM_RE.findall(replication_str)
+    if items:
+        return {
+            key: quoted if value_quote else bare
+            for _, key, value_quote, quoted, bare in items
+        }
+
     try:
         replication_config = ast.literal_eval(replication_str)
         if isinstance(replication_config, dict):
@@ -1,13 +1,48 @@
+import logging
+from itertools import compress
+from operator import not_
+
 from mockylla.parser.materialized_view import rebuild_materialized_views
 from mockylla.parser.utils import (
+    VALUE_SLOT,
+    bind_where_template,
     build_lwt_result,
     check_row_conditions,
+    find_row_by_primary_key,
     get_table,
+    match_flags,
     parse_lwt_clause,
     parse_where_clause,
+    parse_where_template,
     purge_expired_rows,
+    remove_rows,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def _resolve_where_conditions(where_clause_str, parameters, schema):
+    """Parse the WHERE clause, binding ``parameters`` to its placeholders.
+
+    Bound values are cast into the slots of the cached clause template;
+    clauses the template parser can't slot are substituted textually.
+    """
+    if parameters:
+        template = parse_where_template(where_clause_str, schema)
+        if template is not None:
+            slot_count = sum(1 for _, _, val in template if val is VALUE_SLOT)
+            if slot_count != len(parameters):
+                raise ValueError(
+                    "Number of parameters does not match number of placeholders in WHERE clause"
+                )
+            return bind_where_template(template, schema, iter(parameters))
+
+        where_clause_str = _normalise_where_clause(where_clause_str, parameters)
+
+    if not where_clause_str:
+        return []
+    return parse_where_clause(where_clause_str, schema)
+
 
 def _normalise_where_clause(where_clause_str, parameters):
     if not parameters:
@@ -19,23 +54,35 @@ def _normalise_where_clause(where_clause_str, parameters):
             "Number of parameters does not match number of placeholders in WHERE clause"
         )
 
-    final_where = query_parts[0]
-    for idx, param in enumerate(parameters):
-        param_str = f"'{param}'" if isinstance(param, str) else str(param)
-        final_where += param_str + query_parts[idx + 1]
-    return final_where
+    final_where = [query_parts[0]]
+    for param, part in zip(parameters, query_parts[1:]):
+        final_where.append(_quote_parameter(param))
+        final_where.append(part)
+    return "".join(final_where)
 
 
-def _select_rows_matching_conditions(table_data, parsed_conditions):
-    rows_to_delete = []
-    rows_to_keep = []
+def _quote_parameter(param):
+    """Render a bound value as a WHERE clause literal."""
+    if not isinstance(param, str):
+        return str(param)
+    escaped = param.replace("'", "''")
+    return f"'{escaped}'"
 
-    for row in table_data:
-        if check_row_conditions(row, parsed_conditions):
-            rows_to_delete.append(row)
-        else:
-            rows_to_keep.append(row)
 
+def _select_rows_matching_conditions(table_info, parsed_conditions):
+    table_data = table_info["data"]
+    key_values = {col: val for col, op, val in parsed_conditions if op == "="}
+    indexed, row = find_row_by_primary_key(table_info, key_values)
+    if indexed:
+        if row is None or not check_row_conditions(row, parsed_conditions):
+            return [], table_data
+        return [row], [other for other in table_data if other is not row]
+
+    matched = match_flags(table_data, parsed_conditions)
+    rows_to_delete = list(compress(table_data, matched))
+    if not rows_to_delete:
+        return rows_to_delete, table_data
+    rows_to_keep = list(compress(table_data, map(not_, matched)))
     return rows_to_delete, rows_to_keep
 
 
@@ -44,9 +91,8 @@ def _apply_lwt_delete(
     rows_to_delete,
     rows_to_keep,
     lwt_conditions,
-    keyspace_name,
+    table_info,
     table_name,
-    state,
 ):
     deleted_count = len(rows_to_delete)
 
@@ -58,10 +104,8 @@ def _apply_lwt_delete(
     if condition_type == "if_exists":
         if not deleted_count:
             return [build_lwt_result(False)], False
-        state.keyspaces[keyspace_name]["tables"][table_name]["data"] = (
-            rows_to_keep
-        )
-        print(f"Deleted {deleted_count} rows from '{table_name}'")
+        remove_rows(table_info, rows_to_delete, rows_to_keep)
+        logger.debug("Deleted %s rows from '%s'", deleted_count, table_name)
         return [build_lwt_result(True)], True
 
     if condition_type == "conditions":
@@ -70,10 +114,8 @@ def _apply_lwt_delete(
         for row in rows_to_delete:
             if not check_row_conditions(row, lwt_conditions):
                 return [build_lwt_result(False, row)], False
-        state.keyspaces[keyspace_name]["tables"][table_name]["data"] = (
-            rows_to_keep
-        )
-        print(f"Deleted {deleted_count} rows from '{table_name}'")
+        remove_rows(table_info, rows_to_delete, rows_to_keep)
+        logger.debug("Deleted %s rows from '%s'", deleted_count, table_name)
         return [build_lwt_result(True)], True
 
     return None, deleted_count > 0
@@ -86,15 +128,11 @@ def handle_delete_from(delete_match, session, state, parameters=None):
         table_name_full, session, state
     )
     purge_expired_rows(table_info)
-    table_data = table_info["data"]
     schema = table_info["schema"]
 
-    where_clause_str = _normalise_where_clause(where_clause_str, parameters)
-
-    if not where_clause_str:
-        return []
-
-    parsed_conditions = parse_where_clause(where_clause_str, schema)
+    parsed_conditions = _resolve_where_conditions(
+        where_clause_str, parameters, schema
+    )
     if not parsed_conditions:
         return []
 
@@ -103,7 +141,7 @@ def handle_delete_from(delete_match, session, state, parameters=None):
     lwt_conditions = clause_info.get("conditions", [])
 
     rows_to_delete, rows_to_keep = _select_rows_matching_conditions(
-        table_data, parsed_conditions
+        table_info, parsed_conditions
     )
 
     result, mutates_table = _apply_lwt_delete(
@@ -111,9 +149,8 @@ def handle_delete_from(delete_match, session, state, parameters=None):
         rows_to_delete,
         rows_to_keep,
         lwt_conditions,
-        keyspace_name,
+        table_info,
         table_name,
-        state,
     )
 
     if result is not None:
@@ -122,10 +159,10 @@ def handle_delete_from(delete_match, session, state, parameters=None):
         return result
 
     if rows_to_delete:
-        state.keyspaces[keyspace_name]["tables"][table_name]["data"] = (
-            rows_to_keep
+        remove_rows(table_info, rows_to_delete, rows_to_keep)
+        logger.debug(
+            "Deleted %s rows from '%s'", len(rows_to_delete), table_name
         )
-        print(f"Deleted {len(rows_to_delete)} rows from '{table_name}'")
         rebuild_materialized_views(state, keyspace_name, table_name)
 
     return []
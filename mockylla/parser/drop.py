@@ -1,5 +1,11 @@
+import logging
+
 from cassandra import InvalidRequest
 
+from mockylla.parser.utils import forget_table_caches
+
+logger = logging.getLogger(__name__)
+
 
 def handle_drop_keyspace(match, state):
     keyspace_name = match.group(1)
@@ -12,9 +18,10 @@ def handle_drop_keyspace(match, state):
     if keyspace_name in {"system", "system_schema"}:
         raise InvalidRequest(f"Cannot drop system keyspace '{keyspace_name}'")
 
-    del state.keyspaces[keyspace_name]
-    state.update_system_schema()
-    print(f"Dropped keyspace '{keyspace_name}'")
+    keyspace_info = state.keyspaces.pop(keyspace_name)
+    forget_table_caches(keyspace_info.get("tables", {}).values())
+    state.bump_schema_version()
+    logger.debug("Dropped keyspace '%s'", keyspace_name)
     return []
 
 
@@ -36,13 +43,16 @@ def handle_drop_table(drop_table_match, session, state):
             return []
         raise InvalidRequest(f"Table '{table_name_full}' does not exist")
 
-    del state.keyspaces[keyspace_name]["tables"][table_name]
+    table_info = state.keyspaces[keyspace_name]["tables"].pop(table_name)
+    forget_table_caches([table_info])
     views = state.keyspaces[keyspace_name].get("views", {})
     for view_name, view_info in list(views.items()):
         if view_info.get("base_table") == table_name:
             del views[view_name]
-    state.update_system_schema()
-    print(f"Dropped table '{table_name}' from keyspace '{keyspace_name}'")
+    state.bump_schema_version()
+    logger.debug(
+        "Dropped table '%s' from keyspace '%s'", table_name, keyspace_name
+    )
     return []
 
 
@@ -85,6 +95,8 @@ def handle_drop_index(match, session, state):
     if not found and "IF EXISTS" not in match.string.upper():
         raise InvalidRequest(f"Index '{index_name_full}' does not exist")
 
-    state.update_system_schema()
-    print(f"Dropped index '{index_name_full}' in keyspace '{keyspace_name}'")
+    state.bump_schema_version()
+    logger.debug(
+        "Dropped index '%s' in keyspace '%s'", index_name_full, keyspace_name
+    )
     return []
@@ -26,7 +26,7 @@ def handle_create_index(match, session, state):
         )
 
     indexes.append({"name": index_name, "column": target_column})
-    state.update_system_schema()
+    state.bump_schema_version()
     return []
 
 
@@ -1,21 +1,54 @@
+import logging
 import re
+import sys
 import time
+import uuid
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
 
 from cassandra import InvalidRequest
 
 from mockylla.parser.materialized_view import rebuild_materialized_views
 from mockylla.parser.utils import (
+    append_row,
     apply_write_metadata,
     build_lwt_result,
     cast_value,
     current_timestamp_microseconds,
     check_row_conditions,
+    find_row_by_primary_key,
     parse_lwt_clause,
     parse_using_options,
+    primary_key_columns,
     purge_expired_rows,
     row_write_timestamp,
+    setdefault_row,
+    track_ttl_write,
 )
 
+logger = logging.getLogger(__name__)
+
+_UDT_FIELD_RE = re.compile(r"(\w+)\s*:\s*(?:'([^']*)'|([^,}\s]+))")
+_VALUE_DELIMITERS_RE = re.compile(r"[',(){}\[\]]")
+
+# Bound values of these exact types are already what cast_value would return.
+_BOUND_NATIVE_TYPES = {
+    "int": int,
+    "bigint": int,
+    "smallint": int,
+    "tinyint": int,
+    "varint": int,
+    "counter": int,
+    "double": float,
+    "float": float,
+    "decimal": Decimal,
+    "boolean": bool,
+    "uuid": uuid.UUID,
+    "timeuuid": uuid.UUID,
+    "timestamp": datetime,
+}
+
 
 def _parse_udt_literal(literal):
     """Parses a UDT literal string like '{key1: val1, key2: val2}' into a dict."""
@@ -27,7 +60,7 @@ def _parse_udt_literal(literal):
     content = literal[1:-1].strip()
     udt_dict = {}
 
-    for match in re.finditer(r"(\w+)\s*:\s*(?:'([^']*)'|([^,}\s]+))", content):
+    for match in _UDT_FIELD_RE.finditer(content):
         key, val_quoted, val_unquoted = match.groups()
         val = val_quoted if val_quoted is not None else val_unquoted
         udt_dict[key.strip()] = val
@@ -40,24 +73,34 @@ def _parse_values(values_str):
     Example: "1, {key: 'val', key2: 'val2'}, [1, 2, 3]"
     """
     values = []
-    current_val = ""
+    start = 0
     level = 0
-    in_string = False
-
-    for char in values_str:
-        if char == "'" and (len(current_val) == 0 or current_val[-1] != "\\\\"):
-            in_string = not in_string
-        elif char in "({[" and not in_string:
+    search = _VALUE_DELIMITERS_RE.search
+    match = search(values_str)
+
+    while match is not None:
+        index = match.start()
+        char = values_str[index]
+        if char == "'":
+            if index == start or values_str[index - 1] != "\\":
+                # Skip the whole string literal in one jump.
+                close = values_str.find("'", index + 1)
+                while close != -1 and values_str[close - 1] == "\\":
+                    close = values_str.find("'", close + 1)
+                if close == -1:
+                    break
+                index = close
+        elif char == ",":
+            if level == 0:
+                values.append(values_str[start:index].strip())
+                start = index + 1
+        elif char in "({[":
             level += 1
-        elif char in ")}]" and not in_string:
+        else:
             level -= 1
-        elif char == "," and level == 0 and not in_string:
-            values.append(current_val.strip())
-            current_val = ""
-            continue
-        current_val += char
+        match = search(values_str, index + 1)
 
-    values.append(current_val.strip())
+    values.append(values_str[start:].strip())
     return values
 
 
@@ -92,18 +135,7 @@ def _determine_insert_target(table_name_full, session, state):
     if table_info is None:
         raise InvalidRequest(f"Table '{table_name_full}' does not exist")
 
-    return keyspace_name, table_name, table_info
-
-
-def _primary_key_columns(primary_key_info):
-    if isinstance(primary_key_info, dict):
-        pk_columns = primary_key_info.get("all")
-        if pk_columns is None:
-            pk_columns = primary_key_info.get(
-                "partition", []
-            ) + primary_key_info.get("clustering", [])
-        return pk_columns
-    return primary_key_info
+    return keyspace_name, table_name, keyspace_info, table_info
 
 
 def _resolve_write_directives(using_clause):
@@ -112,20 +144,32 @@ def _resolve_write_directives(using_clause):
     )
     if ttl_value is not None and ttl_value < 0:
         raise InvalidRequest("TTL value must be >= 0")
-    write_timestamp = (
-        timestamp_value
-        if timestamp_provided
-        else current_timestamp_microseconds()
-    )
-    now_seconds = (
-        time.time() if ttl_provided and ttl_value and ttl_value > 0 else None
-    )
+    expires = ttl_provided and ttl_value and ttl_value > 0
+    if timestamp_provided and not expires:
+        return ttl_value, ttl_provided, timestamp_value, None
+
+    if timestamp_provided:
+        return ttl_value, ttl_provided, timestamp_value, time.time()
+
+    # A single clock read serves both the write timestamp and the TTL base.
+    write_timestamp = current_timestamp_microseconds()
+    now_seconds = write_timestamp / 1_000_000 if expires else None
     return ttl_value, ttl_provided, write_timestamp, now_seconds
 
 
+@lru_cache(maxsize=1024)
+def _split_columns(columns_str):
+    return tuple(
+        sys.intern(column.strip()) for column in columns_str.split(",")
+    )
+
+
 def _coerce_values(columns_str, values_str, parameters):
-    columns = [column.strip() for column in columns_str.split(",")]
-    values = parameters if parameters else _parse_values(values_str)
+    columns = _split_columns(columns_str)
+    if parameters:
+        values = parameters
+    else:
+        values = _parse_values(values_str)
 
     if len(columns) != len(values):
         raise InvalidRequest(
@@ -134,21 +178,31 @@ def _coerce_values(columns_str, values_str, parameters):
     return columns, values
 
 
-def _build_row_data(columns, values, table_schema, defined_types):
+def _build_row_data(columns, values, table_schema, defined_types, bound=False):
     row_data = {}
     for column, value in zip(columns, values):
         cql_type = table_schema.get(column)
+        if bound and type(value) is _BOUND_NATIVE_TYPES.get(cql_type):
+            row_data[column] = value
+            continue
         row_data[column] = assign_row_data_value(value, cql_type, defined_types)
     return row_data
 
 
-def _find_existing_row(table_rows, primary_key_cols, pk_values):
+def _find_existing_row(table_info, primary_key_cols, new_row):
     if not primary_key_cols:
         return None
-    for candidate in table_rows:
-        if all(
-            candidate.get(key) == pk_values.get(key) for key in primary_key_cols
-        ):
+    missing = [key for key in primary_key_cols if key not in new_row]
+    if missing:
+        raise InvalidRequest(
+            f"Missing primary key columns: {', '.join(missing)}"
+        )
+    indexed, row = find_row_by_primary_key(table_info, new_row)
+    if indexed:
+        return row
+    pk_key = tuple(new_row[key] for key in primary_key_cols)
+    for candidate in table_info["data"]:
+        if tuple(candidate.get(key) for key in primary_key_cols) == pk_key:
             return candidate
     return None
 
@@ -168,7 +222,7 @@ def _append_new_row(
         ttl_provided=ttl_provided,
         now=now_seconds,
     )
-    table_info["data"].append(new_row)
+    append_row(table_info, new_row)
 
 
 def _overwrite_existing_row(
@@ -183,11 +237,14 @@ def _overwrite_existing_row(
     if write_timestamp < existing_ts:
         return False
 
-    previous_meta = existing.get("__meta") if not ttl_provided else None
-    existing.clear()
+    stale_keys = [
+        key for key in existing if key not in new_row and key != "__meta"
+    ]
+    for key in stale_keys:
+        del existing[key]
+    if ttl_provided:
+        existing.pop("__meta", None)
     existing.update(new_row)
-    if previous_meta is not None:
-        existing["__meta"] = previous_meta
 
     apply_write_metadata(
         existing,
@@ -257,6 +314,30 @@ def _apply_lwt_insert(
     return None, False
 
 
+def _insert_plain(
+    table_info, columns, values, table_schema, primary_key_cols, defined_types
+):
+    """Upsert a row for an INSERT without USING or IF clauses."""
+
+    new_row = _build_row_data(
+        columns, values, table_schema, defined_types, bound=True
+    )
+    write_timestamp = current_timestamp_microseconds()
+
+    indexed, existing = setdefault_row(table_info, new_row)
+    if not indexed:
+        existing = _find_existing_row(table_info, primary_key_cols, new_row)
+        if existing is None:
+            append_row(table_info, new_row)
+    if existing is not None:
+        return _overwrite_existing_row(
+            existing, new_row, write_timestamp, None, False, None
+        )
+
+    apply_write_metadata(new_row, timestamp=write_timestamp)
+    return True
+
+
 def handle_insert_into(insert_match, session, state, parameters=None):
     (
         table_name_full,
@@ -266,14 +347,27 @@ def handle_insert_into(insert_match, session, state, parameters=None):
         if_clause,
     ) = insert_match.groups()
 
-    keyspace_name, table_name, table_info = _determine_insert_target(
-        table_name_full, session, state
+    keyspace_name, table_name, keyspace_info, table_info = (
+        _determine_insert_target(table_name_full, session, state)
     )
     purge_expired_rows(table_info)
 
     table_schema = table_info["schema"]
-    primary_key_cols = _primary_key_columns(table_info.get("primary_key", []))
-    defined_types = state.keyspaces[keyspace_name].get("types", {})
+    primary_key_cols = primary_key_columns(table_info.get("primary_key", []))
+    defined_types = keyspace_info.get("types", {})
+
+    if parameters and using_clause is None and if_clause is None:
+        columns, values = _coerce_values(columns_str, values_str, parameters)
+        if _insert_plain(
+            table_info,
+            columns,
+            values,
+            table_schema,
+            primary_key_cols,
+            defined_types,
+        ):
+            rebuild_materialized_views(state, keyspace_name, table_name)
+        return []
 
     (
         ttl_value,
@@ -281,20 +375,18 @@ def handle_insert_into(insert_match, session, state, parameters=None):
         write_timestamp,
         now_seconds,
     ) = _resolve_write_directives(using_clause)
+    track_ttl_write(table_info, ttl_provided, ttl_value, now_seconds)
 
     columns, values = _coerce_values(columns_str, values_str, parameters)
-    row_data = _build_row_data(columns, values, table_schema, defined_types)
-
-    pk_values = {key: row_data.get(key) for key in primary_key_cols or []}
+    new_row = _build_row_data(
+        columns, values, table_schema, defined_types, bound=bool(parameters)
+    )
 
     clause_info = parse_lwt_clause(if_clause, table_schema)
     condition_type = clause_info["type"]
     condition_rows = clause_info.get("conditions", [])
 
-    existing = _find_existing_row(
-        table_info["data"], primary_key_cols, pk_values
-    )
-    new_row = dict(row_data)
+    existing = _find_existing_row(table_info, primary_key_cols, new_row)
 
     result, mutated = _apply_lwt_insert(
         condition_type,
@@ -335,5 +427,5 @@ def handle_insert_into(insert_match, session, state, parameters=None):
         )
 
     rebuild_materialized_views(state, keyspace_name, table_name)
-    print(f"Inserted row into '{table_name}': {row_data}")
+    logger.debug("Inserted row into '%s': %s", table_name, new_row)
     return []
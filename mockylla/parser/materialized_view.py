@@ -1,3 +1,4 @@
+import logging
 import re
 
 from cassandra import InvalidRequest
@@ -5,11 +6,20 @@ from cassandra import InvalidRequest
 from copy import deepcopy
 
 from mockylla.parser.utils import (
+    build_primary_key_info,
+    copy_ttl_tracking,
+    forget_table_caches,
     get_keyspace_and_name,
     get_table,
     parse_with_options,
 )
 
+logger = logging.getLogger(__name__)
+
+_VIEW_AND_RE = re.compile(r"\s+AND\s+", re.IGNORECASE)
+_VIEW_NOT_NULL_RE = re.compile(r"(\w+)\s+IS\s+NOT\s+NULL", re.IGNORECASE)
+_VIEW_EQUALS_RE = re.compile(r"(\w+)\s*=\s*(.+)", re.IGNORECASE)
+
 
 def _split_top_level(value):
     parts = []
@@ -38,7 +48,7 @@ def _parse_primary_key(primary_key_str):
 
     components = _split_top_level(inner)
     if not components:
-        return {"partition": [], "clustering": [], "all": []}
+        return build_primary_key_info([], [])
 
     first = components[0]
     if first.startswith("(") and first.endswith(")"):
@@ -47,11 +57,7 @@ def _parse_primary_key(primary_key_str):
         partition = [first.strip()]
 
     clustering = [comp.strip() for comp in components[1:]]
-    return {
-        "partition": partition,
-        "clustering": clustering,
-        "all": partition + clustering,
-    }
+    return build_primary_key_info(partition, clustering)
 
 
 def _parse_select_columns(select_clause, base_schema):
@@ -67,19 +73,15 @@ def _parse_view_filters(where_clause):
     if not clause:
         return []
     filters = []
-    for condition in re.split(r"\s+AND\s+", clause, flags=re.IGNORECASE):
+    for condition in _VIEW_AND_RE.split(clause):
         condition = condition.strip()
         if not condition:
             continue
-        match_not_null = re.fullmatch(
-            r"(\w+)\s+IS\s+NOT\s+NULL", condition, re.IGNORECASE
-        )
+        match_not_null = _VIEW_NOT_NULL_RE.fullmatch(condition)
         if match_not_null:
             filters.append(("not_null", match_not_null.group(1)))
             continue
-        match_equals = re.fullmatch(
-            r"(\w+)\s*=\s*(.+)", condition, re.IGNORECASE
-        )
+        match_equals = _VIEW_EQUALS_RE.fullmatch(condition)
         if match_equals:
             column = match_equals.group(1)
             value = match_equals.group(2).strip().strip("'\"")
@@ -143,6 +145,7 @@ def rebuild_materialized_views(state, keyspace_name, base_table_name):
             view_rows.append(_project_row(row, columns))
 
         view_table["data"] = view_rows
+        copy_ttl_tracking(base_table, view_table)
 
 
 def handle_create_materialized_view(match, session, state):
@@ -213,9 +216,11 @@ def handle_create_materialized_view(match, session, state):
 
     rebuild_materialized_views(state, keyspace_name, base_table_name)
 
-    state.update_system_schema()
-    print(
-        f"Created materialized view '{view_name}' on base table '{base_table_name}'"
+    state.bump_schema_version()
+    logger.debug(
+        "Created materialized view '%s' on base table '%s'",
+        view_name,
+        base_table_name,
     )
     return []
 
@@ -241,9 +246,13 @@ def handle_drop_materialized_view(match, session, state):
         )
 
     del views[view_name]
-    keyspace["tables"].pop(view_name, None)
-    state.update_system_schema()
-    print(
-        f"Dropped materialized view '{view_name}' in keyspace '{keyspace_name}'"
+    view_table = keyspace["tables"].pop(view_name, None)
+    if view_table is not None:
+        forget_table_caches([view_table])
+    state.bump_schema_version()
+    logger.debug(
+        "Dropped materialized view '%s' in keyspace '%s'",
+        view_name,
+        keyspace_name,
     )
     return []
@@ -1,18 +1,33 @@
+import heapq
+import logging
 import re
 import time
+from collections import defaultdict
+from functools import lru_cache
+from itertools import product, repeat
+from operator import itemgetter
 
 from cassandra import InvalidRequest
 
 from .utils import (
+    VALUE_SLOT,
+    bind_where_template,
     check_row_conditions,
+    filter_rows,
+    find_row_by_primary_key,
+    get_primary_key_index,
     get_table,
+    match_flags,
     parse_where_clause,
+    parse_where_template,
     purge_expired_rows,
     row_ttl,
     row_write_timestamp,
 )
 from mockylla.row import Row
 
+logger = logging.getLogger(__name__)
+
 
 _AGG_SELECT_PATTERN = re.compile(
     r"(count|sum|min|max|avg)\s*\(\s*(distinct\s+)?([^\s\)]+)\s*\)\s*(?:as\s+(\w+)|(\w+))?",
@@ -29,6 +44,8 @@ _COLUMN_SELECT_PATTERN = re.compile(
     re.IGNORECASE,
 )
 
+_LIMIT_PLACEHOLDERS = frozenset({"%s", "?"})
+
 _HAVING_SPLIT_PATTERN = re.compile(r"\s+AND\s+", re.IGNORECASE)
 
 _HAVING_PATTERN = re.compile(
@@ -48,20 +65,23 @@ def handle_select_from(select_match, session, state, parameters=None):
         limit_str,
     ) = select_match.groups()
 
+    keyspace_name, table_name, table_info = get_table(
+        table_name_full, session, state
+    )
+    if keyspace_name == "system_schema":
+        state.maybe_refresh_system_schema()
+    purge_expired_rows(table_info)
+    schema = table_info["schema"]
+
     positional_parameters, named_parameters = __normalize_parameters(parameters)
-    where_clause_str, positional_parameters = __substitute_where_placeholders(
-        where_clause_str, positional_parameters
+    parsed_conditions, positional_parameters = __resolve_where_conditions(
+        where_clause_str, positional_parameters, schema
     )
 
     limit_value, positional_parameters = __resolve_limit_value(
         limit_str, positional_parameters, named_parameters
     )
 
-    _, table_name, table_info = get_table(table_name_full, session, state)
-    purge_expired_rows(table_info)
-    table_data = table_info["data"]
-    schema = table_info["schema"]
-
     columns_str, is_distinct = __extract_distinct_clause(columns_str)
 
     select_items, group_by_columns, having_conditions = (
@@ -80,7 +100,18 @@ def handle_select_from(select_match, session, state, parameters=None):
         select_flags,
     )
 
-    filtered_data = __apply_where_filters(table_data, where_clause_str, schema)
+    if (
+        limit_str is None
+        and not group_by_columns
+        and not having_conditions
+        and not order_by_clause_str
+        and not is_distinct
+        and __is_count_all(select_items)
+    ):
+        count = __count_matching_rows(table_info, parsed_conditions)
+        return [Row(names=[select_items[0]["alias"]], values=[count])]
+
+    filtered_data = __apply_where_filters(table_info, parsed_conditions)
 
     now_seconds = time.time()
 
@@ -98,7 +129,7 @@ def handle_select_from(select_match, session, state, parameters=None):
         now_seconds,
     )
 
-    print(f"Selected {len(result_set)} rows from '{table_name}'")
+    logger.debug("Selected %s rows from '%s'", len(result_set), table_name)
     return result_set
 
 
@@ -116,6 +147,44 @@ def __normalize_parameters(parameters):
     return list(parameters), {}
 
 
+def __resolve_where_conditions(where_clause_str, positional_parameters, schema):
+    """Parse the WHERE clause, consuming positional parameters for its
+    placeholders.
+
+    Placeholders are bound into the slots of the cached clause template, so
+    repeated executions with new values skip parsing. Clauses the template
+    parser can't slot fall back to inlining the values textually.
+    """
+    if not where_clause_str:
+        return [], positional_parameters
+
+    if "%s" in where_clause_str:
+        if not positional_parameters:
+            raise ValueError(
+                "Positional parameters required for WHERE clause placeholders"
+            )
+
+        template = parse_where_template(where_clause_str, schema)
+        if template is not None:
+            slot_count = sum(1 for _, _, val in template if val is VALUE_SLOT)
+            if slot_count > len(positional_parameters):
+                raise ValueError(
+                    "Number of parameters does not match number of placeholders in WHERE clause"
+                )
+            parsed_conditions = bind_where_template(
+                template, schema, iter(positional_parameters)
+            )
+            return parsed_conditions, positional_parameters[slot_count:]
+
+        where_clause_str, positional_parameters = (
+            __substitute_where_placeholders(
+                where_clause_str, positional_parameters
+            )
+        )
+
+    return parse_where_clause(where_clause_str, schema), positional_parameters
+
+
 def __substitute_where_placeholders(where_clause_str, positional_parameters):
     """Inline positional parameters into WHERE clause placeholders."""
     if not where_clause_str or "%s" not in where_clause_str:
@@ -133,14 +202,13 @@ def __substitute_where_placeholders(where_clause_str, positional_parameters):
             "Number of parameters does not match number of placeholders in WHERE clause"
         )
 
-    final_where = query_parts[0]
-    for index in range(placeholder_count):
-        param = positional_parameters[index]
-        param_str = f"'{param}'" if isinstance(param, str) else str(param)
-        final_where += param_str + query_parts[index + 1]
+    pieces = [query_parts[0]]
+    for param, part in zip(positional_parameters, query_parts[1:]):
+        pieces.append(f"'{param}'" if isinstance(param, str) else str(param))
+        pieces.append(part)
 
     remaining_parameters = positional_parameters[placeholder_count:]
-    return final_where, remaining_parameters
+    return "".join(pieces), remaining_parameters
 
 
 def __extract_distinct_clause(columns_str):
@@ -160,7 +228,7 @@ def __parse_select_components(
     columns_str, group_by_clause_str, having_clause_str, schema
 ):
     """Parse SELECT, GROUP BY, and HAVING clauses for the query."""
-    select_items = __parse_select_items(columns_str, schema)
+    select_items = __parse_select_items_cached(columns_str, tuple(schema))
     group_by_columns = __parse_group_by(group_by_clause_str, schema)
     having_conditions = __parse_having_conditions(
         having_clause_str, schema, group_by_columns
@@ -333,7 +401,7 @@ def __execute_select_query(
 
     if order_by_clause_str:
         filtered_data = __apply_order_by(
-            filtered_data, order_by_clause_str, schema
+            filtered_data, order_by_clause_str, schema, limit_value
         )
 
     if limit_value is not None:
@@ -342,21 +410,93 @@ def __execute_select_query(
     return __select_columns(filtered_data, select_items, schema, now_seconds)
 
 
-def __apply_where_filters(table_data, where_clause_str, schema):
-    """Apply WHERE clause filters to the table data."""
-    if not where_clause_str:
-        return list(table_data)
+def __apply_where_filters(table_info, parsed_conditions):
+    """Apply WHERE clause filters to the table data.
 
-    parsed_conditions = parse_where_clause(where_clause_str, schema)
-    return [
-        row
-        for row in table_data
-        if check_row_conditions(row, parsed_conditions)
-    ]
+    Without conditions the table's own row list is returned, so callers
+    must treat the result as read-only.
+    """
+    table_data = table_info["data"]
+    if not parsed_conditions:
+        return table_data
+
+    indexed_rows = __lookup_by_primary_key(table_info, parsed_conditions)
+    if indexed_rows is not None:
+        return indexed_rows
+
+    return filter_rows(table_data, parsed_conditions)
+
+
+def __lookup_by_primary_key(table_info, parsed_conditions):
+    """Resolve full primary key restrictions through the table's hash index.
+
+    Every key column must be pinned by an equality or an IN list; each
+    combination of key values is then probed directly. Returns ``None`` when
+    the conditions do not cover the whole key, or when there are more
+    combinations than rows, and the caller has to scan.
+    """
+    candidates = {}
+    try:
+        for col, op, val in parsed_conditions:
+            if op == "=":
+                candidates[col] = (val,)
+            elif op == "IN" and col not in candidates:
+                candidates[col] = tuple(dict.fromkeys(val))
+    except TypeError:
+        return None
+
+    columns = get_primary_key_index(table_info)["columns"]
+    if not columns or not all(col in candidates for col in columns):
+        return None
+
+    combinations = 1
+    for col in columns:
+        combinations *= len(candidates[col])
+    if combinations > 1 and combinations > len(table_info["data"]):
+        return None
+
+    rows = []
+    for key in product(*(candidates[col] for col in columns)):
+        indexed, row = find_row_by_primary_key(
+            table_info, dict(zip(columns, key))
+        )
+        if not indexed:
+            return None
+        if row is not None and check_row_conditions(row, parsed_conditions):
+            rows.append(row)
+    return rows
 
 
-def __apply_order_by(filtered_data, order_by_clause_str, schema):
-    """Apply ORDER BY clause to filtered data."""
+def __is_count_all(select_items):
+    """Return True for a lone COUNT(*) or COUNT(1) select item."""
+    if len(select_items) != 1:
+        return False
+    item = select_items[0]
+    return (
+        item["type"] == "aggregate"
+        and item["func"] == "count"
+        and not item["distinct"]
+        and item["arg"] in {"*", "1"}
+    )
+
+
+def __count_matching_rows(table_info, parsed_conditions):
+    """Count rows matching the WHERE clause without materialising them."""
+    table_data = table_info["data"]
+    if not parsed_conditions:
+        return len(table_data)
+
+    indexed_rows = __lookup_by_primary_key(table_info, parsed_conditions)
+    if indexed_rows is not None:
+        return len(indexed_rows)
+
+    return sum(match_flags(table_data, parsed_conditions))
+
+
+def __apply_order_by(
+    filtered_data, order_by_clause_str, schema, limit_value=None
+):
+    """Apply ORDER BY clause to filtered data, keeping at most limit_value."""
     order_by_clause_str = order_by_clause_str.strip()
     parts = order_by_clause_str.split()
     order_col = parts[0]
@@ -370,11 +510,16 @@ def __apply_order_by(filtered_data, order_by_clause_str, schema):
             f"Column '{order_col}' in ORDER BY not found in table schema"
         )
 
-    return sorted(
-        filtered_data,
-        key=lambda row: row.get(order_col, None),
-        reverse=(order_dir == "DESC"),
-    )
+    def sort_key(row):
+        return row.get(order_col, None)
+
+    descending = order_dir == "DESC"
+    if limit_value is not None and limit_value < len(filtered_data):
+        # Partial sort; nsmallest/nlargest are stable like sorted()[:n].
+        select = heapq.nlargest if descending else heapq.nsmallest
+        return select(limit_value, filtered_data, key=sort_key)
+
+    return sorted(filtered_data, key=sort_key, reverse=descending)
 
 
 def __apply_limit(filtered_data, limit_value):
@@ -409,9 +554,9 @@ def __resolve_limit_value(limit_token, positional_params, named_params):
         return None, positional_params
 
     if token.isdigit():
-        return __coerce_limit(token), positional_params
+        return int(token), positional_params
 
-    if token in {"%s", "?"}:
+    if token in _LIMIT_PLACEHOLDERS:
         if not positional_params:
             raise InvalidRequest(
                 "LIMIT placeholder requires an additional positional parameter"
@@ -432,6 +577,19 @@ def __resolve_limit_value(limit_token, positional_params, named_params):
     raise InvalidRequest(f"Unsupported LIMIT placeholder '{limit_token}'")
 
 
+@lru_cache(maxsize=1024)
+def __parse_select_items_cached(columns_str, schema_columns):
+    """Parse SELECT items once per column list and set of table columns.
+
+    Parsing only resolves names against the schema, so its column names are
+    a sufficient cache key; the parsed items are shared and must not be
+    mutated.
+    """
+    return tuple(
+        __parse_select_items(columns_str, dict.fromkeys(schema_columns))
+    )
+
+
 def __parse_select_items(columns_str, schema):
     """Parse the SELECT clause into structured items."""
     select_cols_str = columns_str.strip()
@@ -568,18 +726,35 @@ def __validate_group_by_columns(select_items, group_by_columns):
 
 def __resolve_column_name(column, schema):
     """Resolve a column name against the schema in a case-insensitive manner."""
-    for name in schema.keys():
-        if name.lower() == column.lower():
+    if column in schema:
+        return column
+    folded = __fold_case(column)
+    for name in schema:
+        if __fold_case(name) == folded:
             return name
     raise InvalidRequest(f"Column '{column}' not found in table schema")
 
 
+def __fold_case(name):
+    """Case-fold an identifier, taking the cheaper path for ASCII names."""
+    return name.lower() if name.isascii() else name.casefold()
+
+
 def __group_rows(filtered_data, group_by_columns):
     """Group rows by the specified columns."""
-    groups = {}
+    columns = tuple(group_by_columns)
+    get_key = itemgetter(*columns)
+    single_column = len(columns) == 1
+    groups = defaultdict(list)
     for row in filtered_data:
-        key = tuple(row.get(column) for column in group_by_columns)
-        groups.setdefault(key, []).append(row)
+        try:
+            key = get_key(row)
+        except KeyError:
+            key = tuple(row.get(column) for column in columns)
+        else:
+            if single_column:
+                key = (key,)
+        groups[key].append(row)
     return groups
 
 
@@ -587,37 +762,58 @@ def __select_with_aggregates(
     filtered_data, select_items, group_by_columns, having_conditions
 ):
     """Compute aggregate SELECT expressions, optionally grouped."""
-    names = [item["alias"] for item in select_items]
+    names = tuple(item["alias"] for item in select_items)
 
     if not group_by_columns:
         if having_conditions:
             raise InvalidRequest("HAVING clause requires GROUP BY")
-        values = [
-            __compute_aggregate(filtered_data, item) for item in select_items
-        ]
+        values = __compute_aggregates(filtered_data, select_items)
         return [Row(names=names, values=values)]
 
+    key_positions = __group_key_positions(group_by_columns)
+    aggregate_items = []
+    plan = []
+    for item in select_items:
+        if item["type"] == "column":
+            plan.append((True, key_positions[item["name"]]))
+        else:
+            plan.append((False, len(aggregate_items)))
+            aggregate_items.append(item)
+
+    # HAVING aggregates ride along in the same pass over each group's rows.
+    aggregate_count = len(aggregate_items)
+    aggregate_items.extend(
+        {
+            "func": condition["func"],
+            "arg": condition["arg"],
+            "distinct": condition.get("distinct", False),
+        }
+        for condition in having_conditions
+    )
+
     groups = __group_rows(filtered_data, group_by_columns)
     result_set = []
     for key, rows in groups.items():
+        aggregates = __compute_aggregates(rows, aggregate_items)
         if having_conditions and not __check_having_conditions(
-            rows, having_conditions
+            aggregates[aggregate_count:], having_conditions
         ):
             continue
 
-        row_values = []
-        for item in select_items:
-            if item["type"] == "column":
-                idx = group_by_columns.index(item["name"])
-                row_values.append(key[idx])
-            else:
-                row_values.append(__compute_aggregate(rows, item))
-
+        row_values = [
+            key[index] if from_key else aggregates[index]
+            for from_key, index in plan
+        ]
         result_set.append(Row(names=names, values=row_values))
 
     return result_set
 
 
+def __group_key_positions(group_by_columns):
+    """Map each GROUP BY column to its position in the group key."""
+    return {column: index for index, column in enumerate(group_by_columns)}
+
+
 def __select_group_by_only(filtered_data, select_items, group_by_columns):
     """Handle GROUP BY queries without aggregate functions."""
     for item in select_items:
@@ -627,40 +823,53 @@ def __select_group_by_only(filtered_data, select_items, group_by_columns):
             )
 
     groups = __group_rows(filtered_data, group_by_columns)
-    names = [item["alias"] for item in select_items]
-    result_set = []
+    names = tuple(item["alias"] for item in select_items)
+    key_positions = __group_key_positions(group_by_columns)
+    positions = [key_positions[item["name"]] for item in select_items]
 
-    for key in groups.keys():
-        values = []
-        for item in select_items:
-            idx = group_by_columns.index(item["name"])
-            values.append(key[idx])
-        result_set.append(Row(names=names, values=values))
+    return [
+        Row(names=names, values=[key[position] for position in positions])
+        for key in groups
+    ]
 
-    return result_set
 
+def __compute_aggregates(filtered_data, items):
+    """Compute several aggregates, gathering each column's values once.
+
+    Column values are pulled with C-level ``map(dict.get, ...)`` sweeps, and
+    aggregates over the same column share the resulting list.
+    """
+    values_by_column = {
+        column: [
+            value
+            for value in map(dict.get, filtered_data, repeat(column))
+            if value is not None
+        ]
+        for column in {item["arg"] for item in items}
+        if column not in {"*", "1"}
+    }
+
+    computed = {}
+    results = []
+    for item in items:
+        signature = (item["func"], item["arg"], bool(item.get("distinct")))
+        if signature not in computed:
+            computed[signature] = __aggregate_values(
+                item, len(filtered_data), values_by_column.get(item["arg"])
+            )
+        results.append(computed[signature])
+    return results
 
-def __compute_aggregate(filtered_data, item):
+
+def __aggregate_values(item, row_count, values):
     func = item["func"]
-    argument = item["arg"]
 
     if func == "count":
         if item.get("distinct"):
-            values = {
-                row.get(argument)
-                for row in filtered_data
-                if row.get(argument) is not None
-            }
-            return len(values)
-        if argument in {"*", "1"}:
-            return len(filtered_data)
-        return sum(1 for row in filtered_data if row.get(argument) is not None)
-
-    values = [
-        row.get(argument)
-        for row in filtered_data
-        if row.get(argument) is not None
-    ]
+            return len(set(values))
+        if values is None:
+            return row_count
+        return len(values)
 
     if func == "sum":
         return sum(values) if values else 0
@@ -696,6 +905,8 @@ def __parse_having_conditions(having_clause_str, schema, group_by_columns):
 def __split_having_conditions(having_clause_str):
     """Split a HAVING clause into individual condition strings."""
     stripped = having_clause_str.strip()
+    if "and" not in stripped.lower():
+        return [stripped]
     return [part.strip() for part in _HAVING_SPLIT_PATTERN.split(stripped)]
 
 
@@ -746,17 +957,9 @@ def __resolve_having_argument(func, argument, distinct_flag, schema):
     return argument
 
 
-def __check_having_conditions(group_rows, conditions):
-    """Evaluate HAVING conditions for a grouped set of rows."""
-    for condition in conditions:
-        computed = __compute_aggregate(
-            group_rows,
-            {
-                "func": condition["func"],
-                "arg": condition["arg"],
-                "distinct": condition.get("distinct", False),
-            },
-        )
+def __check_having_conditions(computed_values, conditions):
+    """Evaluate HAVING conditions against a group's computed aggregates."""
+    for computed, condition in zip(computed_values, conditions):
         if not __compare_values(
             computed, condition["operator"], condition["value"]
         ):
@@ -815,11 +1018,9 @@ def __compare_values(left, operator, right):
 
 def __select_columns(filtered_data, select_items, schema, now_seconds):
     """Project non-aggregate columns from filtered data."""
-    ordered_keys = list(schema.keys())
-
     if len(select_items) == 1 and select_items[0]["type"] == "wildcard":
-        compiled = [("column", column) for column in ordered_keys]
-        names = ordered_keys
+        compiled = [("column", column) for column in schema]
+        names = schema
     else:
         names = []
         compiled = []
@@ -833,6 +1034,13 @@ def __select_columns(filtered_data, select_items, schema, now_seconds):
             else:
                 raise InvalidRequest("Unsupported SELECT configuration")
 
+    names = tuple(names)
+    if all(item_type == "column" for item_type, _ in compiled):
+        keys = tuple(payload for _, payload in compiled)
+        return [
+            Row(names, map(row_dict.get, keys)) for row_dict in filtered_data
+        ]
+
     result_set = []
     for row_dict in filtered_data:
         values = []
@@ -850,17 +1058,8 @@ def __select_columns(filtered_data, select_items, schema, now_seconds):
 
 def __deduplicate_rows(rows):
     """Remove duplicate rows while preserving order."""
-    unique_rows = []
-    seen = set()
-
-    for row in rows:
-        key = tuple(row)
-        if key in seen:
-            continue
-        seen.add(key)
-        unique_rows.append(row)
-
-    return unique_rows
+    # Keys keep first-seen order; duplicates carry identical values.
+    return list(dict(zip(map(tuple, rows), rows)).values())
 
 
 def __compute_row_function(row_dict, item, now_seconds):
@@ -1,5 +1,9 @@
+import logging
+
 from cassandra import InvalidRequest
 
+logger = logging.getLogger(__name__)
+
 
 def handle_truncate_table(match, session, state):
     """
@@ -21,5 +25,7 @@ def handle_truncate_table(match, session, state):
         raise InvalidRequest(f"Table '{table_name}' does not exist.")
 
     state.keyspaces[keyspace_name]["tables"][table_name]["data"] = []
-    print(f"Truncated table '{table_name}' in keyspace '{keyspace_name}'")
+    logger.debug(
+        "Truncated table '%s' in keyspace '%s'", table_name, keyspace_name
+    )
     return []
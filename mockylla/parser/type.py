@@ -30,3 +30,4 @@ def handle_create_type(match, session, state):
             fields[name.strip()] = type_.strip()
 
     state.keyspaces[keyspace_name]["types"][type_name] = {"fields": fields}
+    state.bump_schema_version()
@@ -1,21 +1,65 @@
+import logging
 import re
 import time
+import uuid
+from copy import deepcopy
+from datetime import date, datetime
+from datetime import time as dt_time
+from decimal import Decimal
+from functools import lru_cache
 
 from cassandra import InvalidRequest
 
 from mockylla.parser.materialized_view import rebuild_materialized_views
 from mockylla.parser.utils import (
+    VALUE_SLOT,
+    append_row,
     apply_write_metadata,
+    bind_where_template,
     build_lwt_result,
     cast_value,
     check_row_conditions,
     current_timestamp_microseconds,
+    filter_rows,
+    find_row_by_primary_key,
     get_table,
+    invalidate_primary_key_index,
     parse_lwt_clause,
     parse_using_options,
     parse_where_clause,
+    parse_where_template,
+    primary_key_columns,
     purge_expired_rows,
     row_write_timestamp,
+    track_ttl_write,
+)
+
+logger = logging.getLogger(__name__)
+
+_IMMUTABLE_VALUE_TYPES = frozenset(
+    {
+        type(None),
+        bool,
+        int,
+        float,
+        str,
+        bytes,
+        Decimal,
+        uuid.UUID,
+        datetime,
+        date,
+        dt_time,
+    }
+)
+
+# One SET assignment: either a counter delta (``c = c + 1``) or a value that
+# may contain commas inside quotes, brackets, braces or parentheses.
+_SET_ITEM_RE = re.compile(
+    r"\s*(\w+)\s*=\s*"
+    r"(?:\1\s*([+-])\s*(\d+)\s*(?=,|$)"
+    r"|((?:'[^']*'|\"[^\"]*\"|\[[^\]]*\]|\{[^}]*\}|\([^)]*\)|[^,'\"\[{(])+))"
+    r"\s*(?:,|$)",
+    re.IGNORECASE,
 )
 
 
@@ -49,7 +93,9 @@ def _resolve_write_directives(using_clause):
 
 
 def _normalise_update_clauses(set_clause_str, where_clause_str, parameters):
-    if not parameters or "%s" not in (set_clause_str + where_clause_str):
+    if not parameters or (
+        "%s" not in set_clause_str and "%s" not in where_clause_str
+    ):
         return set_clause_str, where_clause_str
 
     set_clause_str, next_idx = replace_placeholders(
@@ -61,14 +107,36 @@ def _normalise_update_clauses(set_clause_str, where_clause_str, parameters):
     return set_clause_str, where_clause_str
 
 
-def _find_matching_rows(table_data, parsed_conditions):
+def _find_matching_rows(table, parsed_conditions):
+    """Return rows matching the WHERE equalities, via the primary key index
+    when the conditions pin down the whole key."""
+    key_values = {col: val for col, op, val in parsed_conditions if op == "="}
+    indexed, row = find_row_by_primary_key(table, key_values)
+    if indexed:
+        if row is None or not __handle_update_check_row(row, parsed_conditions):
+            return []
+        return [row]
+
+    equalities = [
+        condition for condition in parsed_conditions if condition[1] == "="
+    ]
+    if all(val is not None for _, _, val in equalities):
+        return filter_rows(table["data"], equalities)
     return [
         row
-        for row in table_data
+        for row in table["data"]
         if __handle_update_check_row(row, parsed_conditions)
     ]
 
 
+def _changes_primary_key(table, set_operations, counter_operations):
+    """Return True when the SET clause assigns a primary key column."""
+    return any(
+        column in set_operations or column in counter_operations
+        for column in primary_key_columns(table.get("primary_key", []))
+    )
+
+
 def _determine_write_timestamp(timestamp_value, timestamp_provided):
     return (
         timestamp_value
@@ -83,70 +151,21 @@ def _resolve_now_seconds(ttl_provided, ttl_value):
     return None
 
 
-def _apply_conditional_update(
-    condition_type,
-    lwt_conditions,
-    matching_rows,
-    table,
-    table_name,
-    parsed_conditions,
-    set_operations,
-    counter_operations,
-    write_timestamp,
-    ttl_value,
-    ttl_provided,
-    now_seconds,
-):
+def _reject_conditional_update(condition_type, lwt_conditions, matching_rows):
+    """Return the LWT result when the IF clause rejects the update, else None."""
     if condition_type == "if_not_exists":
         if matching_rows:
-            return [build_lwt_result(False, matching_rows[0])], False
-        __handle_upsert(
-            table,
-            table_name,
-            parsed_conditions,
-            set_operations,
-            counter_operations,
-            write_timestamp,
-            ttl_value,
-            ttl_provided,
-            now_seconds,
-        )
-        return [build_lwt_result(True)], True
+            return [build_lwt_result(False, matching_rows[0])]
+        return None
 
-    if condition_type == "if_exists":
+    if condition_type in {"if_exists", "conditions"}:
         if not matching_rows:
-            return [build_lwt_result(False)], False
-        rows_updated = __update_existing_rows(
-            table,
-            parsed_conditions,
-            set_operations,
-            counter_operations,
-            write_timestamp,
-            ttl_value,
-            ttl_provided,
-            now_seconds,
-        )
-        return [build_lwt_result(True)], rows_updated > 0
-
-    if condition_type == "conditions":
-        if not matching_rows:
-            return [build_lwt_result(False)], False
-        for row in matching_rows:
-            if not check_row_conditions(row, lwt_conditions):
-                return [build_lwt_result(False, row)], False
-        rows_updated = __update_existing_rows(
-            table,
-            parsed_conditions,
-            set_operations,
-            counter_operations,
-            write_timestamp,
-            ttl_value,
-            ttl_provided,
-            now_seconds,
-        )
-        return [build_lwt_result(True)], rows_updated > 0
-
-    return None, False
+            return [build_lwt_result(False)]
+        if condition_type == "conditions":
+            for row in matching_rows:
+                if not check_row_conditions(row, lwt_conditions):
+                    return [build_lwt_result(False, row)]
+    return None
 
 
 def handle_update(update_match, session, state, parameters=None):
@@ -166,54 +185,53 @@ def handle_update(update_match, session, state, parameters=None):
         timestamp_provided,
     ) = _resolve_write_directives(using_clause)
 
-    set_clause_str, where_clause_str = _normalise_update_clauses(
-        set_clause_str, where_clause_str, parameters
-    )
-
     keyspace_name, table_name, table = get_table(
         table_name_full, session, state
     )
     schema = table["schema"]
     purge_expired_rows(table)
 
-    set_operations, counter_operations = __parse_set_clause(
-        set_clause_str, schema
+    set_operations, counter_operations, parsed_conditions = (
+        _parse_update_clauses(
+            set_clause_str, where_clause_str, schema, parameters
+        )
     )
-    parsed_conditions = parse_where_clause(where_clause_str, schema)
 
     clause_info = parse_lwt_clause(if_clause, schema)
     condition_type = clause_info["type"]
     lwt_conditions = clause_info.get("conditions", [])
 
-    matching_rows = _find_matching_rows(table["data"], parsed_conditions)
+    matching_rows = _find_matching_rows(table, parsed_conditions)
+    rejection = _reject_conditional_update(
+        condition_type, lwt_conditions, matching_rows
+    )
+    if rejection is not None:
+        return rejection
+
+    # Only writes that go ahead read the clock.
     write_timestamp = _determine_write_timestamp(
         timestamp_value, timestamp_provided
     )
     now_seconds = _resolve_now_seconds(ttl_provided, ttl_value)
+    track_ttl_write(table, ttl_provided, ttl_value, now_seconds)
 
-    result, mutates_table = _apply_conditional_update(
-        condition_type,
-        lwt_conditions,
-        matching_rows,
-        table,
-        table_name,
-        parsed_conditions,
-        set_operations,
-        counter_operations,
-        write_timestamp,
-        ttl_value,
-        ttl_provided,
-        now_seconds,
-    )
-
-    if result is not None:
-        if mutates_table:
-            rebuild_materialized_views(state, keyspace_name, table_name)
-        return result
+    if condition_type == "if_not_exists":
+        __handle_upsert(
+            table,
+            table_name,
+            parsed_conditions,
+            set_operations,
+            counter_operations,
+            write_timestamp,
+            ttl_value,
+            ttl_provided,
+            now_seconds,
+        )
+        rebuild_materialized_views(state, keyspace_name, table_name)
+        return [build_lwt_result(True)]
 
     rows_updated = __update_existing_rows(
-        table,
-        parsed_conditions,
+        matching_rows,
         set_operations,
         counter_operations,
         write_timestamp,
@@ -223,8 +241,14 @@ def handle_update(update_match, session, state, parameters=None):
     )
 
     if rows_updated > 0:
-        print(f"Updated {rows_updated} rows in '{table_name}'")
+        logger.debug("Updated %s rows in '%s'", rows_updated, table_name)
+        if _changes_primary_key(table, set_operations, counter_operations):
+            invalidate_primary_key_index(table)
         rebuild_materialized_views(state, keyspace_name, table_name)
+
+    if condition_type != "none":
+        return [build_lwt_result(True)]
+    if rows_updated > 0:
         return []
 
     if not matching_rows:
@@ -243,37 +267,148 @@ def handle_update(update_match, session, state, parameters=None):
     return []
 
 
-def __parse_set_clause(set_clause_str, schema):
-    """Parse SET clause into regular and counter operations."""
-    set_operations = {}
-    counter_operations = {}
-    set_pairs = [s.strip() for s in set_clause_str.split(",")]
+def _parse_update_clauses(set_clause_str, where_clause_str, schema, parameters):
+    """Return the SET operations and WHERE conditions of an UPDATE.
 
-    for pair in set_pairs:
-        counter_match = re.match(
-            r"(\w+)\s*=\s*\1\s*([+-])\s*(\d+)", pair, re.IGNORECASE
+    Parameterised statements are parsed once as a template and the bound
+    values are cast straight into its slots. Templates the slot parser can't
+    handle fall back to substituting the values into the query text.
+    """
+    if parameters and ("%s" in set_clause_str or "%s" in where_clause_str):
+        template = _parse_update_template(
+            set_clause_str, where_clause_str, tuple(schema.items())
         )
-        if counter_match:
-            col, op, val_str = counter_match.groups()
-            val = int(val_str)
-            if op == "-":
-                val = -val
-            counter_operations[col] = val
-        else:
-            col, val_str = [p.strip() for p in pair.split("=", 1)]
-            val = val_str.strip("'\"")
+        if template is not None:
+            return _bind_update_template(template, schema, parameters)
+
+    set_clause_str, where_clause_str = _normalise_update_clauses(
+        set_clause_str, where_clause_str, parameters
+    )
+    set_operations, counter_operations = _parse_set_clause(
+        set_clause_str, schema
+    )
+    parsed_conditions = parse_where_clause(where_clause_str, schema)
+    return set_operations, counter_operations, parsed_conditions
+
+
+@lru_cache(maxsize=1024)
+def _parse_update_template(set_clause_str, where_clause_str, schema_items):
+    if "()" in set_clause_str:
+        return None
+    schema = dict(schema_items)
+    where_conditions = parse_where_template(where_clause_str, schema)
+    if where_conditions is None:
+        return None
+
+    set_operations, counter_operations = __parse_set_clause(
+        set_clause_str, schema, bind_markers=True
+    )
+    slot_count = sum(
+        1 for value in set_operations.values() if value is VALUE_SLOT
+    )
+    # Markers outside a plain "col = %s" assignment (counter deltas, quoted
+    # text, repeated columns) are left to textual substitution.
+    if slot_count != set_clause_str.count("%s"):
+        return None
+
+    slot_count += sum(1 for _, _, val in where_conditions if val is VALUE_SLOT)
+    return (
+        tuple(set_operations.items()),
+        tuple(counter_operations.items()),
+        where_conditions,
+        slot_count,
+    )
+
+
+def _bind_update_template(template, schema, parameters):
+    set_items, counter_items, where_conditions, slot_count = template
+    if slot_count > len(parameters):
+        raise ValueError(
+            "Number of parameters does not match number of placeholders in UPDATE query"
+        )
+
+    values = iter(parameters)
+    set_operations = {}
+    for col, value in set_items:
+        if value is VALUE_SLOT:
+            value = next(values)
             cql_type = schema.get(col)
             if cql_type:
-                set_operations[col] = cast_value(val, cql_type)
-            else:
-                set_operations[col] = val
+                value = cast_value(value, cql_type)
+        elif type(value) not in _IMMUTABLE_VALUE_TYPES:
+            value = deepcopy(value)
+        set_operations[col] = value
+
+    parsed_conditions = bind_where_template(where_conditions, schema, values)
+    return set_operations, dict(counter_items), parsed_conditions
+
+
+def _parse_set_clause(set_clause_str, schema):
+    """Parse a SET clause, reusing earlier parses of the same clause text.
+
+    Clauses calling functions such as ``now()`` are parsed afresh, and
+    mutable cast values are copied so rows never share collection objects.
+    """
+    if "()" in set_clause_str:
+        return __parse_set_clause(set_clause_str, schema)
+
+    set_items, counter_items = _parse_set_clause_cached(
+        set_clause_str, tuple(schema.items())
+    )
+    set_operations = {
+        col: value if type(value) in _IMMUTABLE_VALUE_TYPES else deepcopy(value)
+        for col, value in set_items
+    }
+    return set_operations, dict(counter_items)
+
+
+@lru_cache(maxsize=1024)
+def _parse_set_clause_cached(set_clause_str, schema_items):
+    set_operations, counter_operations = __parse_set_clause(
+        set_clause_str, dict(schema_items)
+    )
+    return tuple(set_operations.items()), tuple(counter_operations.items())
+
+
+def __parse_set_clause(set_clause_str, schema, bind_markers=False):
+    """Parse SET clause into regular and counter operations.
+
+    With ``bind_markers`` a bare ``%s`` value is kept as :data:`VALUE_SLOT`.
+    """
+    set_operations = {}
+    counter_operations = {}
+    set_clause_str = set_clause_str.strip()
+    pos = 0
+    end = len(set_clause_str)
+
+    while pos < end:
+        item = _SET_ITEM_RE.match(set_clause_str, pos)
+        if item is None:
+            raise InvalidRequest(f"Invalid SET clause: {set_clause_str}")
+        pos = item.end()
+        col, op, delta, val_str = item.groups()
+        if op is not None:
+            val = int(delta)
+            counter_operations[col] = -val if op == "-" else val
+            continue
+
+        val_str = val_str.strip()
+        if bind_markers and val_str == "%s":
+            set_operations[col] = VALUE_SLOT
+            continue
+
+        val = val_str.strip("'\"")
+        cql_type = schema.get(col)
+        if cql_type:
+            set_operations[col] = cast_value(val, cql_type)
+        else:
+            set_operations[col] = val
 
     return set_operations, counter_operations
 
 
 def __update_existing_rows(
-    table,
-    parsed_conditions,
+    matching_rows,
     set_operations,
     counter_operations,
     write_timestamp,
@@ -281,24 +416,23 @@ def __update_existing_rows(
     ttl_provided,
     now_seconds,
 ):
-    """Update existing rows that match conditions."""
+    """Apply the update to the rows matched by the WHERE clause."""
     rows_updated = 0
-    for row in table["data"]:
-        if __handle_update_check_row(row, parsed_conditions):
-            existing_ts = row_write_timestamp(row)
-            if write_timestamp < existing_ts:
-                continue
-            row.update(set_operations)
-            for col, val in counter_operations.items():
-                row[col] = row.get(col, 0) + val
-            apply_write_metadata(
-                row,
-                timestamp=write_timestamp,
-                ttl_value=ttl_value,
-                ttl_provided=ttl_provided,
-                now=now_seconds,
-            )
-            rows_updated += 1
+    for row in matching_rows:
+        existing_ts = row_write_timestamp(row)
+        if write_timestamp < existing_ts:
+            continue
+        row.update(set_operations)
+        for col, val in counter_operations.items():
+            row[col] = row.get(col, 0) + val
+        apply_write_metadata(
+            row,
+            timestamp=write_timestamp,
+            ttl_value=ttl_value,
+            ttl_provided=ttl_provided,
+            now=now_seconds,
+        )
+        rows_updated += 1
     return rows_updated
 
 
@@ -335,8 +469,8 @@ def __handle_upsert(
         ttl_provided=ttl_provided,
         now=now_seconds,
     )
-    table["data"].append(new_row)
-    print(f"Upserted row in '{table_name}': {new_row}")
+    append_row(table, new_row)
+    logger.debug("Upserted row in '%s': %s", table_name, new_row)
 
 
 def __handle_update_check_row(row, parsed_conditions):
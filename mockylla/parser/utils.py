@@ -1,14 +1,36 @@
 import ast
+import operator
 import re
 import time
 import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import lru_cache, partial
+from itertools import compress, repeat
 
 from cassandra import InvalidRequest
 
 from mockylla.row import Row
 
+_USING_OPTION_RE = re.compile(r"(?i)^(TTL|TIMESTAMP)\s+(.+)$")
+_AND_SPLIT_RE = re.compile(r"\s+AND\s+", re.IGNORECASE)
+_LITERAL_KEYWORD_RE = re.compile(r"\b(true|false|null)\b")
+_WHERE_IN_RE = re.compile(r"(\w+)\s+IN\s+\((.*)\)", re.IGNORECASE)
+_WHERE_COMPARISON_RE = re.compile(
+    r"(\w+)\s*([<>=]+)\s*(?:'((?:[^']|'')*)'|\"([^\"]*)\"|([\w\.-]+))"
+)
+_WHERE_SLOT_RE = re.compile(r"(\w+)\s*([<>=]+)\s*%s$")
+
+# Stands in for a ``%s`` bind marker in a parsed statement template.
+VALUE_SLOT = object()
+
+
+def _split_on_and(clause):
+    """Split ``clause`` on the AND keyword, skipping the regex when absent."""
+    if "and" not in clause.lower():
+        return [clause]
+    return _AND_SPLIT_RE.split(clause)
+
 
 def cast_value(value, cql_type):
     """Casts a value to a Python type based on CQL type."""
@@ -16,23 +38,35 @@ def cast_value(value, cql_type):
     if value is None:
         return None
 
-    cql_type = (cql_type or "").lower()
-
     if isinstance(value, (list, tuple)):
         return value
 
-    caster = _CASTERS.get(cql_type)
+    caster = _caster_for(cql_type)
     if caster:
         return caster(value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _caster_for(cql_type):
+    """Resolve the caster for a declared CQL type, or ``None`` to keep values.
+
+    Schemas hold a handful of distinct type strings, so each one is
+    lower-cased and matched against the caster table only once.
+    """
+    cql_type = (cql_type or "").lower()
+
+    caster = _CASTERS.get(cql_type)
+    if caster:
+        return caster
 
     if cql_type.startswith("list<"):
-        return _cast_list(value, cql_type)
+        return partial(_cast_list, cql_type=cql_type)
     if cql_type.startswith("set<"):
-        return _cast_set(value, cql_type)
+        return partial(_cast_set, cql_type=cql_type)
     if cql_type.startswith("map<"):
-        return _cast_map(value, cql_type)
-
-    return value
+        return partial(_cast_map, cql_type=cql_type)
+    return None
 
 
 def get_keyspace_and_name(name_full, session_keyspace):
@@ -55,14 +89,231 @@ def get_table(table_name_full, session, state):
         table_name_full, session.keyspace
     )
 
+    try:
+        table_info = state.keyspaces[keyspace_name]["tables"][table_name]
+    except KeyError:
+        raise InvalidRequest(
+            f"Table '{table_name_full}' does not exist"
+        ) from None
+    return keyspace_name, table_name, table_info
+
+
+def build_primary_key_info(partition, clustering):
+    """Build the stored primary key layout, flattening the full key once."""
+    partition = list(partition)
+    clustering = list(clustering)
+    return {
+        "partition": partition,
+        "clustering": clustering,
+        "all": partition + clustering,
+    }
+
+
+def primary_key_columns(primary_key_info):
+    """Return the full list of primary key columns for stored key info."""
+    if isinstance(primary_key_info, dict):
+        pk_columns = primary_key_info.get("all")
+        if pk_columns is None:
+            pk_columns = primary_key_info.get(
+                "partition", []
+            ) + primary_key_info.get("clustering", [])
+        return pk_columns
+    return primary_key_info
+
+
+# Derived per-table data is kept here rather than in the table dicts that
+# get_tables() hands out. Entries are keyed by id(table_info) and hold the
+# table itself, so a recycled id never matches a different table.
+_TABLE_CACHES = {}
+
+
+def _table_cache(table_info):
+    """Return the private cache entry for ``table_info``, creating it."""
+    cache = _TABLE_CACHES.get(id(table_info))
+    if cache is None or cache["table"] is not table_info:
+        cache = {
+            "table": table_info,
+            "pk_index": None,
+            "exposed": False,
+            # Earliest pending TTL expiry; only meaningful once known.
+            "next_expiry": None,
+            "expiry_known": False,
+        }
+        _TABLE_CACHES[id(table_info)] = cache
+    return cache
+
+
+def forget_table_caches(tables):
+    """Drop the private caches kept for ``tables``."""
+    for table_info in tables:
+        cache = _TABLE_CACHES.get(id(table_info))
+        if cache is not None and cache["table"] is table_info:
+            del _TABLE_CACHES[id(table_info)]
+
+
+def expose_table(table_info):
+    """Mark a table whose row dicts have been handed out to callers.
+
+    Such rows can be changed without the mock noticing, so primary key
+    lookups on the table stop answering from the index and scan instead.
+    """
+    _table_cache(table_info)["exposed"] = True
+
+
+def invalidate_primary_key_index(table_info):
+    """Drop the primary key index after a write changed key columns."""
+    _table_cache(table_info)["pk_index"] = None
+
+
+def get_primary_key_index(table_info):
+    """Return the primary key hash index for ``table_info``, rebuilding if stale.
+
+    The index maps a tuple of primary key values to its row. It remembers the
+    ``data`` list it was built from and that list's length, so any code path
+    that replaces or grows ``data`` without going through the helpers below
+    simply causes a rebuild on the next lookup.
+    """
+    cache = _table_cache(table_info)
+    data = table_info["data"]
+    index = cache["pk_index"]
     if (
-        keyspace_name not in state.keyspaces
-        or table_name not in state.keyspaces[keyspace_name]["tables"]
+        index is not None
+        and index["data"] is data
+        and index["size"] == len(data)
     ):
-        raise InvalidRequest(f"Table '{table_name_full}' does not exist")
+        return index
+
+    columns = tuple(primary_key_columns(table_info.get("primary_key", [])))
+    rows = {}
+    unique = bool(columns)
+    if unique:
+        try:
+            for row in data:
+                key = tuple(row.get(column) for column in columns)
+                if key in rows:
+                    unique = False
+                    break
+                rows[key] = row
+        except TypeError:
+            unique = False
+
+    index = {
+        "data": data,
+        "size": len(data),
+        "columns": columns,
+        "key_of": _key_getter(columns) if columns else None,
+        "rows": rows,
+        "unique": unique,
+    }
+    cache["pk_index"] = index
+    return index
+
+
+def _key_getter(columns):
+    """Return a callable extracting ``columns`` from a mapping as a tuple."""
+    if len(columns) == 1:
+        (column,) = columns
+        return lambda mapping: (mapping[column],)
+    return operator.itemgetter(*columns)
+
+
+def find_row_by_primary_key(table_info, values):
+    """Look up a row by its full primary key.
+
+    ``values`` maps column names to values. Returns ``(indexed, row)`` where
+    ``indexed`` is False when the index cannot answer the lookup (missing key
+    columns, unhashable values, duplicate keys or rows exposed to callers)
+    and the caller must scan.
+    """
+    if _table_cache(table_info)["exposed"]:
+        return False, None
+    index = get_primary_key_index(table_info)
+    if not index["unique"]:
+        return False, None
+
+    columns = index["columns"]
+    try:
+        key = index["key_of"](values)
+        row = index["rows"].get(key)
+    except (KeyError, TypeError):
+        return False, None
+
+    if row is not None and tuple(map(row.get, columns)) != key:
+        # The row's key columns were changed in place; rebuild and retry.
+        invalidate_primary_key_index(table_info)
+        return find_row_by_primary_key(table_info, values)
+    return True, row
+
+
+def append_row(table_info, row):
+    """Append ``row`` to the table and keep the primary key index current."""
+    data = table_info["data"]
+    index = get_primary_key_index(table_info)
+    data.append(row)
+    index["size"] += 1
+    if not index["unique"]:
+        return
+
+    try:
+        key = tuple(row.get(column) for column in index["columns"])
+        if key in index["rows"]:
+            index["unique"] = False
+        else:
+            index["rows"][key] = row
+    except TypeError:
+        index["unique"] = False
 
-    table_info = state.keyspaces[keyspace_name]["tables"][table_name]
-    return keyspace_name, table_name, table_info
+
+def setdefault_row(table_info, row):
+    """Append ``row`` unless a row with the same primary key is stored.
+
+    This is :func:`find_row_by_primary_key` and :func:`append_row` in a
+    single index probe. Returns ``(indexed, existing)``: ``existing`` is the
+    row already holding the key, or ``None`` once ``row`` has been appended.
+    When ``indexed`` is False nothing was appended and the caller must scan.
+    """
+    if _table_cache(table_info)["exposed"]:
+        return False, None
+    index = get_primary_key_index(table_info)
+    if not index["unique"]:
+        return False, None
+
+    try:
+        key = index["key_of"](row)
+        existing = index["rows"].setdefault(key, row)
+    except (KeyError, TypeError):
+        return False, None
+
+    if existing is row:
+        table_info["data"].append(row)
+        index["size"] += 1
+        return True, None
+    if tuple(map(existing.get, index["columns"])) != key:
+        # The stored row's key columns were changed in place; rebuild.
+        invalidate_primary_key_index(table_info)
+        return setdefault_row(table_info, row)
+    return True, existing
+
+
+def remove_rows(table_info, removed_rows, retained_rows):
+    """Replace table data with ``retained_rows``, dropping ``removed_rows``.
+
+    Removed rows are also dropped from the primary key index so that it stays
+    valid without a full rebuild.
+    """
+    index = get_primary_key_index(table_info)
+    table_info["data"] = retained_rows
+    index["data"] = retained_rows
+    index["size"] = len(retained_rows)
+    if not index["unique"]:
+        return
+
+    rows = index["rows"]
+    columns = index["columns"]
+    for row in removed_rows:
+        key = tuple(row.get(column) for column in columns)
+        if rows.get(key) is row:
+            del rows[key]
 
 
 def parse_with_options(options_str):
@@ -73,7 +324,7 @@ def parse_with_options(options_str):
 
     options = {}
     # Normalize spacing and split by AND while respecting case-insensitivity
-    parts = re.split(r"\s+AND\s+", options_str.strip(), flags=re.IGNORECASE)
+    parts = _split_on_and(options_str.strip())
 
     for part in parts:
         cleaned = part.strip().rstrip(";")
@@ -92,37 +343,90 @@ def parse_with_options(options_str):
 
 
 def parse_where_clause(where_clause_str, schema):
-    """Parse WHERE clause conditions into structured format."""
+    """Parse WHERE clause conditions into structured format.
+
+    Results are cached per clause text and schema. Clauses calling ``now()``
+    or ``uuid()`` are parsed afresh since each call yields a new value.
+    """
     where_clause_str = where_clause_str.rstrip(";")
 
     if not where_clause_str:
         return []
 
-    conditions = [
-        cond.strip()
-        for cond in re.split(
-            r"\s+AND\s+", where_clause_str, flags=re.IGNORECASE
-        )
-    ]
+    if "()" in where_clause_str:
+        return _parse_where_conditions(where_clause_str, schema)
+
+    return list(_parse_where_cached(where_clause_str, tuple(schema.items())))
+
+
+@lru_cache(maxsize=1024)
+def _parse_where_cached(where_clause_str, schema_items):
+    return tuple(_parse_where_conditions(where_clause_str, dict(schema_items)))
+
+
+def _parse_where_conditions(where_clause_str, schema):
+    conditions = [cond.strip() for cond in _split_on_and(where_clause_str)]
 
     return __parse_conditions(conditions, schema)
 
 
+def parse_where_template(where_clause_str, schema):
+    """Parse a WHERE clause whose values may be ``%s`` bind markers.
+
+    Conditions compared against a marker carry :data:`VALUE_SLOT` as their
+    value, to be filled in by :func:`bind_where_template`. Returns ``None``
+    when a marker appears anywhere else (inside an IN list, quoted, ...) or
+    the clause calls a function, so the caller has to substitute textually.
+    """
+    return _parse_where_template_cached(
+        where_clause_str.rstrip(";"), tuple(schema.items())
+    )
+
+
+@lru_cache(maxsize=1024)
+def _parse_where_template_cached(where_clause_str, schema_items):
+    if not where_clause_str:
+        return ()
+    if "()" in where_clause_str:
+        return None
+
+    schema = dict(schema_items)
+    conditions = []
+    for cond in _split_on_and(where_clause_str):
+        cond = cond.strip()
+        slot = _WHERE_SLOT_RE.match(cond)
+        if slot:
+            conditions.append((slot.group(1), slot.group(2), VALUE_SLOT))
+        elif "%s" in cond:
+            return None
+        else:
+            conditions.extend(__parse_conditions([cond], schema))
+    return tuple(conditions)
+
+
+def bind_where_template(conditions, schema, values):
+    """Fill the slots of a parsed WHERE template from the ``values`` iterator."""
+    bound = []
+    for col, op, val in conditions:
+        if val is VALUE_SLOT:
+            val = next(values)
+            cql_type = schema.get(col)
+            if cql_type:
+                val = cast_value(val, cql_type)
+        bound.append((col, op, val))
+    return bound
+
+
 def __parse_conditions(conditions, schema):
     """Parse conditions into structured format."""
     parsed_conditions = []
     for cond in conditions:
-        in_match = re.match(
-            r"(\w+)\s+IN\s+\((.*)\)", cond.strip(), re.IGNORECASE
-        )
+        in_match = _WHERE_IN_RE.match(cond.strip())
         if in_match:
             parsed_conditions.append(__parse_in_condition(in_match, schema))
             continue
 
-        match = re.match(
-            r"(\w+)\s*([<>=]+)\s*(?:'([^']*)'|\"([^\"]*)\"|([\w\.-]+))",
-            cond.strip(),
-        )
+        match = _WHERE_COMPARISON_RE.match(cond.strip())
         if match:
             parsed_conditions.append(
                 __parse_comparison_condition(match, schema)
@@ -133,7 +437,7 @@ def __parse_conditions(conditions, schema):
 def __parse_in_condition(in_match, schema):
     """Parse IN condition from regex match."""
     col, values_str = in_match.groups()
-    values = [v.strip().strip("'\"") for v in values_str.split(",")]
+    values = [__unquote_literal(v.strip()) for v in values_str.split(",")]
 
     cql_type = schema.get(col)
     if cql_type:
@@ -142,10 +446,21 @@ def __parse_in_condition(in_match, schema):
     return (col, "IN", values)
 
 
+def __unquote_literal(literal):
+    """Strip quotes from a CQL literal, undoing ``''`` escapes."""
+    if len(literal) > 1 and literal[0] == literal[-1] == "'":
+        return literal[1:-1].replace("''", "'")
+    return literal.strip("'\"")
+
+
 def __parse_comparison_condition(match, schema):
     """Parse comparison condition from regex match."""
-    col, op, v1, v2, v3 = match.groups()
-    val = next((v for v in [v1, v2, v3] if v is not None), None)
+    col, op = match.group(1, 2)
+    # Exactly one of the three value alternatives matched, and it is the last
+    # group to participate, so lastindex picks it even for an empty string.
+    val = match.group(match.lastindex)
+    if match.lastindex == 3:
+        val = val.replace("''", "'")
 
     cql_type = schema.get(col)
     if cql_type:
@@ -161,28 +476,141 @@ def check_row_conditions(row, parsed_conditions):
         if row_val is None:
             return False
 
-        if not __check_condition(row_val, op, val):
+        if not _CONDITION_OPERATORS.get(op, _never)(row_val, val):
             return False
     return True
 
 
-def __check_condition(row_val, op, val):
-    """Check if a single condition is met."""
-    if op == "=":
-        return row_val == val
-    elif op == ">":
-        return row_val > val
-    elif op == "<":
-        return row_val < val
-    elif op == ">=":
-        return row_val >= val
-    elif op == "<=":
-        return row_val <= val
-    elif op == "IN":
-        return row_val in val
+def _contains(row_val, val):
+    return row_val in val
+
+
+def _never(_row_val, _val):
     return False
 
 
+_CONDITION_OPERATORS = {
+    "=": operator.eq,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+    "IN": _contains,
+}
+
+
+# Cheaper and usually more selective checks run first so rows fail early.
+_CONDITION_PRIORITY = {
+    "=": 0,
+    "IN": 1,
+    ">": 2,
+    "<": 2,
+    ">=": 2,
+    "<=": 2,
+}
+
+
+def compile_row_filter(parsed_conditions):
+    """Return a predicate equivalent to :func:`check_row_conditions`.
+
+    Operators are resolved once up front, and equality checks are ordered
+    ahead of IN and range checks, so scanning many rows only pays for the
+    column lookups and comparisons needed to reject each row.
+    """
+    ordered = sorted(
+        parsed_conditions,
+        key=lambda condition: _CONDITION_PRIORITY.get(condition[1], 3),
+    )
+    checks = tuple(
+        (col, _CONDITION_OPERATORS.get(op, _never), val)
+        for col, op, val in ordered
+    )
+
+    if len(checks) == 1:
+        ((col, check, val),) = checks
+
+        def matches(row):
+            row_val = row.get(col)
+            return row_val is not None and check(row_val, val)
+
+        return matches
+
+    def matches(row):
+        for col, check, val in checks:
+            row_val = row.get(col)
+            if row_val is None or not check(row_val, val):
+                return False
+        return True
+
+    return matches
+
+
+def filter_rows(rows, parsed_conditions):
+    """Return the rows matching every parsed condition as a new list.
+
+    Equality checks against a concrete value are applied first as C-level
+    ``compress``/``map`` passes; the remaining conditions run through
+    :func:`compile_row_filter` on the already narrowed rows.
+    """
+    remaining = []
+    for col, op, val in parsed_conditions:
+        if op == "=" and val is not None:
+            rows = list(
+                compress(
+                    rows,
+                    map(
+                        operator.eq,
+                        map(dict.get, rows, repeat(col)),
+                        repeat(val),
+                    ),
+                )
+            )
+        else:
+            remaining.append((col, op, val))
+
+    if remaining:
+        matches = compile_row_filter(remaining)
+        return [row for row in rows if matches(row)]
+    if not parsed_conditions:
+        return list(rows)
+    return rows
+
+
+def match_flags(rows, parsed_conditions):
+    """Return a list holding, for each row, whether it matches every condition.
+
+    Like :func:`filter_rows`, equality checks run as C-level ``map`` passes;
+    callers that need both the matching rows and the rest can split ``rows``
+    with ``compress`` without evaluating the conditions twice.
+    """
+    flags = None
+    remaining = []
+    for col, op, val in parsed_conditions:
+        if op == "=" and val is not None:
+            column_flags = map(
+                operator.eq, map(dict.get, rows, repeat(col)), repeat(val)
+            )
+        else:
+            remaining.append((col, op, val))
+            continue
+        flags = (
+            column_flags
+            if flags is None
+            else map(operator.and_, flags, column_flags)
+        )
+
+    if remaining:
+        column_flags = map(compile_row_filter(remaining), rows)
+        flags = (
+            column_flags
+            if flags is None
+            else map(operator.and_, flags, column_flags)
+        )
+    if flags is None:
+        return [True] * len(rows)
+    return list(flags)
+
+
 def _cast_int(value):
     return int(_strip_quotes(value))
 
@@ -331,7 +759,7 @@ def _normalise_literal_booleans(value):
             "null": "None",
         }[token]
 
-    return re.sub(r"\b(true|false|null)\b", replacer, value)
+    return _LITERAL_KEYWORD_RE.sub(replacer, value)
 
 
 _CASTERS = {
@@ -359,36 +787,88 @@ _CASTERS = {
 }
 
 
+_last_write_timestamp = 0
+
+
 def current_timestamp_microseconds():
-    """Return current wall-clock time in microseconds."""
+    """Return current wall-clock time in microseconds.
+
+    Successive calls are strictly increasing, so writes issued within the
+    same clock tick still resolve last-write-wins in issue order.
+    """
+    global _last_write_timestamp
 
-    return int(time.time() * 1_000_000)
+    now = time.time_ns() // 1000
+    if now <= _last_write_timestamp:
+        now = _last_write_timestamp + 1
+    _last_write_timestamp = now
+    return now
 
 
 def purge_expired_rows(table_info, *, now=None):
-    """Remove rows whose TTL has elapsed from table_info in-place."""
+    """Remove rows whose TTL has elapsed from table_info in-place.
+
+    The earliest pending expiry is tracked privately per table, so the rows
+    are only scanned once something can actually have expired. Tables whose
+    rows were handed out to callers are scanned every time.
+    """
 
     if not table_info:
         return
 
-    rows = table_info.get("data")
-    if not rows:
-        return
+    cache = _table_cache(table_info)
+    if cache["expiry_known"] and not cache["exposed"]:
+        next_expiry = cache["next_expiry"]
+        if next_expiry is None:
+            return
+        now = time.time() if now is None else now
+        if now < next_expiry:
+            return
+    elif now is None:
+        now = time.time()
 
-    now = time.time() if now is None else now
     retained = []
-    changed = False
+    expired = []
+    upcoming = None
 
-    for row in rows:
+    for row in table_info.get("data") or ():
         meta = row.get("__meta") if isinstance(row, dict) else None
         expires_at = meta.get("expires_at") if meta else None
-        if expires_at is not None and expires_at <= now:
-            changed = True
-            continue
-        retained.append(row)
+        if expires_at is None:
+            retained.append(row)
+        elif expires_at <= now:
+            expired.append(row)
+        else:
+            retained.append(row)
+            if upcoming is None or expires_at < upcoming:
+                upcoming = expires_at
+
+    cache["next_expiry"] = upcoming
+    cache["expiry_known"] = True
+    if expired:
+        remove_rows(table_info, expired, retained)
+
+
+def track_ttl_write(table_info, ttl_provided, ttl_value, now):
+    """Record the expiry of a TTL write as the table's next purge point."""
 
-    if changed:
-        table_info["data"] = retained
+    if ttl_provided and ttl_value and ttl_value > 0:
+        cache = _table_cache(table_info)
+        if not cache["expiry_known"]:
+            return
+        expires_at = now + ttl_value
+        next_expiry = cache["next_expiry"]
+        if next_expiry is None or expires_at < next_expiry:
+            cache["next_expiry"] = expires_at
+
+
+def copy_ttl_tracking(source_table, target_table):
+    """Give ``target_table`` the pending expiry tracked for ``source_table``."""
+
+    source = _table_cache(source_table)
+    target = _table_cache(target_table)
+    target["next_expiry"] = source["next_expiry"]
+    target["expiry_known"] = source["expiry_known"]
 
 
 def apply_write_metadata(
@@ -497,12 +977,16 @@ def parse_using_options(using_clause):
 
     if not using_clause:
         return None, False, None, False
+    return _parse_using_clause(using_clause)
+
 
+@lru_cache(maxsize=256)
+def _parse_using_clause(using_clause):
     clause = using_clause.strip()
     if not clause:
         return None, False, None, False
 
-    parts = re.split(r"\s+AND\s+", clause, flags=re.IGNORECASE)
+    parts = _split_on_and(clause)
     ttl_value = None
     ttl_provided = False
     timestamp_value = None
@@ -512,7 +996,7 @@ def parse_using_options(using_clause):
         token = part.strip()
         if not token:
             continue
-        match = re.match(r"(?i)^(TTL|TIMESTAMP)\s+(.+)$", token)
+        match = _USING_OPTION_RE.match(token)
         if not match:
             continue
         keyword, value = match.groups()
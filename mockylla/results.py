@@ -80,7 +80,9 @@ class ResultSet(Sequence):
             return None
 
     def all(self):
-        return list(self)
+        remaining = self._all_rows[self._position :]
+        self._position = len(self._all_rows)
+        return remaining
 
     @property
     def current_rows(self):
@@ -2,15 +2,18 @@ from collections.abc import Sequence
 
 
 class Row(Sequence):
+    # Column attributes still live in the instance dict; the slots keep the
+    # row's own bookkeeping out of it, so it is filled with a single update.
+    __slots__ = ("__dict__", "_names", "_values")
+
     def __init__(self, names, values):
-        self._names = tuple(names)
-        self._values = tuple(values)
+        self._names = names = tuple(names)
+        self._values = values = tuple(values)
 
-        if len(self._names) != len(self._values):
+        if len(names) != len(values):
             raise ValueError("Length of names and values must be the same.")
 
-        for name, value in zip(self._names, self._values):
-            setattr(self, name, value)
+        self.__dict__.update(zip(names, values))
 
     def __getitem__(self, key):
         if isinstance(key, str):
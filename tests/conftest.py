@@ -0,0 +1,13 @@
+import pytest
+from cassandra.cluster import Cluster
+
+
+@pytest.fixture(scope="session")
+def cluster():
+    """A driver cluster shared by every test.
+
+    ``connect`` is patched on the class while a mock is active, so each test
+    still gets a session bound to its own fresh state.
+    """
+
+    return Cluster(["127.0.0.1"])
@@ -1,5 +1,7 @@
-from mockylla import mock_scylladb
 from cassandra.cluster import Cluster
+from cassandra.connection import Connection
+
+from mockylla import MockScyllaDB, mock_scylladb
 
 
 @mock_scylladb
@@ -15,3 +17,15 @@ def test_mock_connection():
     rows = session.execute("SELECT * FROM system.local")
 
     assert len(rows) == 1
+
+
+def test_nested_mocks_keep_separate_connection_factories():
+    outer = MockScyllaDB()
+    inner = MockScyllaDB()
+    with outer:
+        Connection.factory("outer")
+        with inner:
+            Connection.factory("inner")
+
+    outer.connection_factory.assert_called_once_with("outer")
+    inner.connection_factory.assert_called_once_with("inner")
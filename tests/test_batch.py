@@ -48,6 +48,32 @@ class TestBatchStatements(unittest.TestCase):
         session.execute("DROP TABLE mytable")
         session.execute("DROP KEYSPACE mykeyspace")
 
+    @mock_scylladb
+    def test_batch_keeps_semicolons_inside_string_literals(self):
+        cluster = Cluster(["127.0.0.1"])
+        session = cluster.connect()
+        session.execute(
+            "CREATE KEYSPACE mykeyspace WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+        )
+        session.set_keyspace("mykeyspace")
+        session.execute("CREATE TABLE mytable (id int PRIMARY KEY, value text)")
+
+        session.execute("""
+        BEGIN BATCH
+            INSERT INTO mytable (id, value) VALUES (1, 'a;b');
+            INSERT INTO mytable (id, value) VALUES (2, 'two');
+            UPDATE mytable SET value = 'c;d' WHERE id = 2;
+        APPLY BATCH;
+        """)
+
+        rows = sorted(
+            session.execute("SELECT id, value FROM mytable"),
+            key=lambda r: r.id,
+        )
+        self.assertEqual(
+            [(r.id, r.value) for r in rows], [(1, "a;b"), (2, "c;d")]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
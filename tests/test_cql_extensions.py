@@ -2,7 +2,7 @@ import time
 
 from cassandra.cluster import Cluster
 
-from mockylla import mock_scylladb
+from mockylla import MockScyllaDB, get_table_rows, mock_scylladb
 
 
 def _setup_basic_table(session):
@@ -62,6 +62,22 @@ def test_insert_ttl_expires():
     assert session.execute("SELECT name FROM users WHERE id = 1").one() is None
 
 
+@mock_scylladb
+def test_ttl_expiry_rewritten_through_get_table_rows_is_honoured():
+    cluster = Cluster()
+    session = cluster.connect()
+    _setup_basic_table(session)
+
+    session.execute(
+        "INSERT INTO users (id, name, email) VALUES (1, 'Eve', 'eve@example.com') USING TTL 1000"
+    )
+
+    (row,) = get_table_rows("ks", "users")
+    row["__meta"]["expires_at"] = time.time() - 1
+
+    assert session.execute("SELECT name FROM users WHERE id = 1").one() is None
+
+
 @mock_scylladb
 def test_update_with_timestamp_clause():
     cluster = Cluster()
@@ -141,3 +157,21 @@ def test_select_ttl_and_writetime_functions():
     assert row.ttl_name is not None
     assert 0 <= row.ttl_name <= 120
     assert row.wt_name == timestamp
+
+
+def test_literal_insert_wins_over_earlier_updates_with_frozen_clock(
+    monkeypatch,
+):
+    monkeypatch.setattr(time, "time", lambda: 1_700_000_000.0)
+    monkeypatch.setattr(time, "time_ns", lambda: 1_700_000_000_000_000_000)
+
+    with MockScyllaDB():
+        session = Cluster().connect()
+        _setup_basic_table(session)
+
+        session.execute("UPDATE users SET name = 'upd1' WHERE id = 1")
+        session.execute("UPDATE users SET name = 'upd2' WHERE id = 1")
+        session.execute("INSERT INTO users (id, name) VALUES (1, 'ins')")
+
+        row = session.execute("SELECT name FROM users WHERE id = 1").one()
+        assert row.name == "ins"
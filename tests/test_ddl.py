@@ -1,13 +1,11 @@
 import pytest
 from cassandra import InvalidRequest
-from cassandra.cluster import Cluster
 
 from mockylla import get_keyspaces, mock_scylladb
 
 
 @mock_scylladb
-def test_drop_keyspace_removes_metadata():
-    cluster = Cluster()
+def test_drop_keyspace_removes_metadata(cluster):
     session = cluster.connect()
 
     session.execute(
@@ -22,8 +20,7 @@ def test_drop_keyspace_removes_metadata():
 
 
 @mock_scylladb
-def test_drop_keyspace_if_not_exists_is_noop():
-    cluster = Cluster()
+def test_drop_keyspace_if_not_exists_is_noop(cluster):
     session = cluster.connect()
 
     session.execute("DROP KEYSPACE IF EXISTS missing")
@@ -32,16 +29,15 @@ def test_drop_keyspace_if_not_exists_is_noop():
 
 
 @mock_scylladb
-def test_drop_system_keyspace_raises():
-    session = Cluster().connect()
+def test_drop_system_keyspace_raises(cluster):
+    session = cluster.connect()
 
     with pytest.raises(InvalidRequest):
         session.execute("DROP KEYSPACE system")
 
 
 @mock_scylladb
-def test_drop_index_updates_state_and_metadata():
-    cluster = Cluster()
+def test_drop_index_updates_state_and_metadata(cluster):
     session = cluster.connect()
 
     session.execute(
@@ -68,8 +64,8 @@ def test_drop_index_updates_state_and_metadata():
 
 
 @mock_scylladb
-def test_drop_index_if_exists_suppresses_error():
-    session = Cluster().connect()
+def test_drop_index_if_exists_suppresses_error(cluster):
+    session = cluster.connect()
     session.execute(
         "CREATE KEYSPACE ks WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
     )
@@ -80,8 +76,7 @@ def test_drop_index_if_exists_suppresses_error():
 
 
 @mock_scylladb
-def test_alter_table_with_updates_options():
-    cluster = Cluster()
+def test_alter_table_with_updates_options(cluster):
     session = cluster.connect()
 
     session.execute(
@@ -102,8 +97,7 @@ def test_alter_table_with_updates_options():
 
 
 @mock_scylladb
-def test_materialized_view_create_and_drop():
-    cluster = Cluster()
+def test_materialized_view_create_and_drop(cluster):
     session = cluster.connect()
 
     session.execute(
@@ -135,3 +135,107 @@ def test_delete_if_condition():
     )
     assert result_success.one()["[applied]"] is True
     assert len(get_table_rows(keyspace_name, table_name)) == 0
+
+
+@mock_scylladb
+def test_delete_with_parameter_containing_quote():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+
+    session.execute(
+        "CREATE KEYSPACE my_keyspace WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("my_keyspace")
+    session.execute("CREATE TABLE my_table (name text PRIMARY KEY, city text)")
+    session.execute(
+        "INSERT INTO my_table (name, city) VALUES (%s, %s)",
+        ("O'Brien", "Dublin"),
+    )
+    session.execute(
+        "INSERT INTO my_table (name, city) VALUES (%s, %s)", ("Bob", "Paris")
+    )
+
+    session.execute("DELETE FROM my_table WHERE name = %s", ("O'Brien",))
+
+    remaining_rows = get_table_rows("my_keyspace", "my_table")
+    assert [row["name"] for row in remaining_rows] == ["Bob"]
+
+
+@mock_scylladb
+def test_delete_by_full_primary_key_keeps_other_rows():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+
+    session.execute(
+        "CREATE KEYSPACE my_keyspace WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("my_keyspace")
+    session.execute(
+        "CREATE TABLE events (user_id int, seq int, payload text, "
+        "PRIMARY KEY (user_id, seq))"
+    )
+    for user_id in range(3):
+        for seq in range(3):
+            session.execute(
+                "INSERT INTO events (user_id, seq, payload) VALUES (%s, %s, %s)",
+                (user_id, seq, f"{user_id}-{seq}"),
+            )
+
+    session.execute("DELETE FROM events WHERE user_id = 1 AND seq = 2")
+    session.execute("DELETE FROM events WHERE user_id = 1 AND seq = 2")
+    session.execute(
+        "INSERT INTO events (user_id, seq, payload) VALUES (1, 2, 'again')"
+    )
+    session.execute("DELETE FROM events WHERE user_id = 2")
+
+    rows = get_table_rows("my_keyspace", "events")
+    payloads = sorted(row["payload"] for row in rows)
+    assert payloads == ["0-0", "0-1", "0-2", "1-0", "1-1", "again"]
+
+
+@mock_scylladb
+def test_delete_with_parameter_containing_keywords_and_markers():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+
+    session.execute(
+        "CREATE KEYSPACE my_keyspace WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("my_keyspace")
+    session.execute("CREATE TABLE my_table (name text PRIMARY KEY, city text)")
+    for name in ("100%s AND 'more' rows", "Bob"):
+        session.execute(
+            "INSERT INTO my_table (name, city) VALUES (%s, %s)", (name, "x")
+        )
+
+    session.execute(
+        "DELETE FROM my_table WHERE name = %s", ("100%s AND 'more' rows",)
+    )
+
+    remaining_rows = get_table_rows("my_keyspace", "my_table")
+    assert [row["name"] for row in remaining_rows] == ["Bob"]
+
+
+@mock_scylladb
+def test_delete_with_parameters_containing_both_quote_kinds():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+
+    session.execute(
+        "CREATE KEYSPACE my_keyspace WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("my_keyspace")
+    session.execute("CREATE TABLE my_table (name text PRIMARY KEY, city text)")
+    names = ('O\'Brien "Jr" Smith', 'It\'s "x" too', "Rock'n'roll", "Bob")
+    for name in names:
+        session.execute(
+            "INSERT INTO my_table (name, city) VALUES (%s, %s)", (name, "x")
+        )
+
+    session.execute("DELETE FROM my_table WHERE name = %s", (names[0],))
+    session.execute(
+        "DELETE FROM my_table WHERE name IN (%s, %s)", (names[1], names[2])
+    )
+
+    remaining_rows = get_table_rows("my_keyspace", "my_table")
+    assert [row["name"] for row in remaining_rows] == ["Bob"]
@@ -1,3 +1,9 @@
+import uuid
+from datetime import datetime
+
+import pytest
+from cassandra import InvalidRequest
+
 from mockylla import mock_scylladb, get_table_rows
 from cassandra.cluster import Cluster
 
@@ -121,3 +127,104 @@ def test_insert_if_condition():
     rows = get_table_rows(keyspace_name, table_name)
     assert any(row["name"] == "Bob" for row in rows)
     assert not any(row["name"] == "Charlie" for row in rows)
+
+
+@mock_scylladb
+def test_insert_upserts_by_primary_key_across_truncate():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+
+    session.execute(
+        "CREATE KEYSPACE my_app "
+        "WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("my_app")
+    session.execute("CREATE TABLE users (user_id int PRIMARY KEY, name text)")
+
+    insert_query = "INSERT INTO users (user_id, name) VALUES (%s, %s)"
+    for user_id in range(5):
+        session.execute(insert_query, (user_id, f"user-{user_id}"))
+    session.execute(insert_query, (3, "updated"))
+
+    rows = get_table_rows("my_app", "users")
+    assert len(rows) == 5
+    assert {row["user_id"]: row["name"] for row in rows}[3] == "updated"
+
+    session.execute("TRUNCATE users")
+    session.execute(insert_query, (3, "fresh"))
+    session.execute(insert_query, (3, "fresher"))
+
+    rows = get_table_rows("my_app", "users")
+    assert [(row["user_id"], row["name"]) for row in rows] == [(3, "fresher")]
+
+
+@mock_scylladb
+def test_insert_with_parameters_keeps_native_values_and_casts_others():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+    session.execute(
+        "CREATE KEYSPACE ks "
+        "WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.execute(
+        "CREATE TABLE ks.events (id uuid PRIMARY KEY, seen timestamp, hits int)"
+    )
+
+    event_id = uuid.uuid4()
+    session.execute(
+        "INSERT INTO ks.events (id, seen, hits) VALUES (%s, %s, %s)",
+        (event_id, 0, "3"),
+    )
+
+    (row,) = get_table_rows("ks", "events")
+    assert row["id"] is event_id
+    assert isinstance(row["seen"], datetime)
+    assert row["hits"] == 3
+
+
+@mock_scylladb
+def test_insert_without_primary_key_column_is_rejected():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+    session.execute(
+        "CREATE KEYSPACE ks "
+        "WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.execute(
+        "CREATE TABLE ks.events (day int, seq int, body text, "
+        "PRIMARY KEY (day, seq))"
+    )
+
+    with pytest.raises(InvalidRequest, match="seq"):
+        session.execute("INSERT INTO ks.events (day, body) VALUES (1, 'x')")
+
+    assert get_table_rows("ks", "events") == []
+
+
+@mock_scylladb
+def test_insert_with_parameters_records_writetime_and_checks_key():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+    session.execute(
+        "CREATE KEYSPACE ks "
+        "WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.execute(
+        "CREATE TABLE ks.events (day int, seq int, body text, "
+        "PRIMARY KEY (day, seq))"
+    )
+
+    session.execute(
+        "INSERT INTO ks.events (day, seq, body) VALUES (%s, %s, %s)",
+        (1, 1, "x"),
+    )
+    row = session.execute(
+        "SELECT WRITETIME(body) AS ts FROM ks.events WHERE day = 1 AND seq = 1"
+    ).one()
+    assert row.ts > 0
+
+    with pytest.raises(InvalidRequest, match="seq"):
+        session.execute(
+            "INSERT INTO ks.events (day, body) VALUES (%s, %s)", (2, "y")
+        )
+    assert len(get_table_rows("ks", "events")) == 1
@@ -1,14 +1,12 @@
 from mockylla import mock_scylladb, get_keyspaces
-from cassandra.cluster import Cluster
 
 
 @mock_scylladb
-def test_create_keyspace():
+def test_create_keyspace(cluster):
     """
     Tests that a keyspace can be created and inspected.
     """
 
-    cluster = Cluster(["127.0.0.1"])
     session = cluster.connect()
     keyspace_name = "my_test_keyspace"
 
@@ -19,3 +17,19 @@ def test_create_keyspace():
 
     created_keyspaces = get_keyspaces()
     assert keyspace_name in created_keyspaces
+
+
+@mock_scylladb
+def test_create_keyspace_records_replication_options(cluster):
+    session = cluster.connect()
+
+    session.execute(
+        "CREATE KEYSPACE multi_dc WITH REPLICATION = "
+        "{'class': 'NetworkTopologyStrategy', 'dc1': 3, 'dc2': '2'}"
+    )
+
+    assert get_keyspaces()["multi_dc"]["replication"] == {
+        "class": "NetworkTopologyStrategy",
+        "dc1": "3",
+        "dc2": "2",
+    }
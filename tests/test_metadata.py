@@ -1,6 +1,6 @@
 from cassandra.cluster import Cluster
 
-from mockylla import mock_scylladb, get_tables
+from mockylla import ScyllaState, get_keyspaces, get_tables, mock_scylladb
 
 
 @mock_scylladb
@@ -107,3 +107,80 @@ def test_composite_primary_key_metadata():
     assert columns_by_name["bucket"].kind == "partition_key"
     assert columns_by_name["created_at"].kind == "clustering"
     assert columns_by_name["created_at"].clustering_order == "desc"
+
+
+def test_system_schema_rows_rebuilt_only_after_schema_change():
+    state = ScyllaState()
+    tables = state.keyspaces["system_schema"]["tables"]
+    state.maybe_refresh_system_schema()
+    keyspace_rows = tables["keyspaces"]["data"]
+
+    state.maybe_refresh_system_schema()
+    assert tables["keyspaces"]["data"] is keyspace_rows
+
+    state.keyspaces["ks"] = {"tables": {}, "types": {}, "views": {}}
+    state.bump_schema_version()
+    state.update_system_schema()
+
+    names = {row["keyspace_name"] for row in tables["keyspaces"]["data"]}
+    assert "ks" in names
+
+
+@mock_scylladb
+def test_cluster_metadata_is_cached_until_schema_changes():
+    cluster = Cluster()
+    session = cluster.connect()
+
+    session.execute(
+        "CREATE KEYSPACE ks WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    first = cluster.metadata.get_keyspace("ks")
+    assert cluster.metadata.get_keyspace("ks") is first
+
+    session.execute("CREATE TABLE ks.users (id int PRIMARY KEY, name text)")
+    refreshed = cluster.metadata.get_keyspace("ks")
+    assert refreshed is not first
+    assert "users" in refreshed.tables
+
+
+@mock_scylladb
+def test_system_schema_refresh_is_deferred_until_read():
+    cluster = Cluster()
+    session = cluster.connect()
+
+    session.execute(
+        "CREATE KEYSPACE ks WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    schema_tables = session.state.keyspaces["system_schema"]["tables"]
+    stored_before = list(schema_tables["tables"]["data"])
+    for index in range(3):
+        session.execute(f"CREATE TABLE ks.t{index} (id int PRIMARY KEY)")
+
+    assert schema_tables["tables"]["data"] == stored_before
+
+    rows = session.execute(
+        "SELECT table_name FROM system_schema.tables WHERE keyspace_name = 'ks'"
+    ).all()
+    assert {row.table_name for row in rows} == {"t0", "t1", "t2"}
+
+
+@mock_scylladb
+def test_state_helpers_return_current_system_schema_rows():
+    session = Cluster().connect()
+    session.execute(
+        "CREATE KEYSPACE ks WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.execute("CREATE TABLE ks.users (id int PRIMARY KEY)")
+
+    tables = get_tables("system_schema")["tables"]["data"]
+    assert {"keyspace_name": "ks", "table_name": "users"} in tables
+
+    session.execute("CREATE TABLE ks.orders (id int PRIMARY KEY)")
+
+    schema_tables = get_keyspaces()["system_schema"]["tables"]
+    names = {row["table_name"] for row in schema_tables["tables"]["data"]}
+    assert {"users", "orders"} <= names
+    keyspace_names = {
+        row["keyspace_name"] for row in schema_tables["keyspaces"]["data"]
+    }
+    assert "ks" in keyspace_names
@@ -1,5 +1,6 @@
 import pytest
 
+from cassandra import ConsistencyLevel
 from cassandra.cluster import Cluster
 
 from mockylla import mock_scylladb
@@ -67,6 +68,26 @@ def test_prepared_statement_missing_parameter_raises():
         ps.bind({"name": "Bob", "active": True, "id": 1, "extra": 5})
 
 
+@mock_scylladb
+def test_unexpected_parameter_with_repeated_placeholder_raises():
+    cluster = Cluster()
+    session = cluster.connect()
+    _setup_users(session)
+
+    ps = session.prepare("SELECT * FROM users WHERE id > ? AND id < ?")
+    assert ps.bind({"id": 1}).values == (1, 1)
+
+    with pytest.raises(
+        ValueError, match="Unexpected parameters for prepared statement: typo"
+    ):
+        ps.bind({"id": 1, "typo": 3})
+
+    with pytest.raises(
+        ValueError, match="Unexpected parameters for prepared statement: typo"
+    ):
+        session.execute(ps, {"id": 1, "typo": 3})
+
+
 @mock_scylladb
 def test_prepared_statement_update_and_delete():
     cluster = Cluster()
@@ -85,3 +106,23 @@ def test_prepared_statement_update_and_delete():
     session.execute(delete_ps.bind((1,)))
 
     assert session.execute("SELECT * FROM users WHERE id = 1").one() is None
+
+
+@mock_scylladb
+def test_prepare_returns_independent_statements_for_same_query():
+    cluster = Cluster()
+    session = cluster.connect()
+    _setup_users(session)
+    session.execute("INSERT INTO users (id, name) VALUES (1, 'Alice')")
+
+    query = "SELECT name FROM users WHERE id = ?"
+    first = session.prepare(query)
+    second = session.prepare(query)
+    assert second is not first
+    assert second.param_order is first.param_order
+
+    first.fetch_size = 10
+    first.consistency_level = ConsistencyLevel.QUORUM
+    assert not hasattr(second, "fetch_size")
+    assert not hasattr(second, "consistency_level")
+    assert session.execute(second.bind((1,))).one().name == "Alice"
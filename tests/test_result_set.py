@@ -29,6 +29,17 @@ def test_all_returns_remaining_rows():
     assert result.one() is None
 
 
+def test_all_exhausts_result_and_returns_a_copy():
+    rows = _make_rows(2)
+    result = ResultSet(rows)
+
+    fetched = result.all()
+    fetched.clear()
+
+    assert result.all() == []
+    assert result[:] == rows
+
+
 def test_current_rows_tracks_remaining_rows():
     result = ResultSet(_make_rows(2))
 
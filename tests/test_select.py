@@ -159,6 +159,28 @@ def test_select_count_star():
     assert row["count"] == 2
 
 
+@mock_scylladb
+def test_select_count_star_with_where_clause():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+
+    session.execute(
+        "CREATE KEYSPACE count_keyspace WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("count_keyspace")
+    session.execute("CREATE TABLE people (id int PRIMARY KEY, city text)")
+
+    session.execute("INSERT INTO people (id, city) VALUES (1, 'Paris')")
+    session.execute("INSERT INTO people (id, city) VALUES (2, 'Lyon')")
+    session.execute("INSERT INTO people (id, city) VALUES (3, 'Paris')")
+
+    row = session.execute(
+        "SELECT COUNT(1) FROM people WHERE city = 'Paris' ALLOW FILTERING"
+    ).one()
+
+    assert row.count == 2
+
+
 @mock_scylladb
 def test_select_count_star_alias():
     cluster = Cluster(["127.0.0.1"])
@@ -684,3 +706,126 @@ def test_select_unknown_column_error():
 
     with pytest.raises(InvalidRequest):
         session.execute(f"SELECT unknown_column FROM {table_name}")
+
+
+@mock_scylladb
+def test_select_by_full_primary_key_applies_remaining_conditions():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+
+    session.execute(
+        "CREATE KEYSPACE pk_keyspace WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("pk_keyspace")
+    session.execute(
+        "CREATE TABLE events (day int, seq int, kind text, PRIMARY KEY (day, seq))"
+    )
+    session.execute("INSERT INTO events (day, seq, kind) VALUES (1, 1, 'a')")
+    session.execute("INSERT INTO events (day, seq, kind) VALUES (1, 2, 'b')")
+
+    rows = session.execute(
+        "SELECT kind FROM events WHERE day = 1 AND seq = 2"
+    ).all()
+    assert [row.kind for row in rows] == ["b"]
+
+    rows = session.execute(
+        "SELECT kind FROM events WHERE day = 1 AND seq = 2 AND kind = 'a' "
+        "ALLOW FILTERING"
+    ).all()
+    assert rows == []
+
+
+@mock_scylladb
+def test_select_filter_combines_equality_and_range_conditions():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+
+    session.execute(
+        "CREATE KEYSPACE filter_keyspace WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("filter_keyspace")
+    session.execute(
+        "CREATE TABLE scores (id int PRIMARY KEY, team text, points int)"
+    )
+    session.execute("INSERT INTO scores (id, team, points) VALUES (1, 'a', 5)")
+    session.execute("INSERT INTO scores (id, team, points) VALUES (2, 'a', 9)")
+    session.execute("INSERT INTO scores (id, team) VALUES (3, 'a')")
+    session.execute("INSERT INTO scores (id, team, points) VALUES (4, 'b', 9)")
+
+    rows = session.execute(
+        "SELECT id FROM scores WHERE points > 6 AND team = 'a' ALLOW FILTERING"
+    ).all()
+    assert [row.id for row in rows] == [2]
+
+
+@mock_scylladb
+def test_select_binds_parameters_containing_quotes_and_keywords():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+    session.execute(
+        "CREATE KEYSPACE ks WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("ks")
+    session.execute("CREATE TABLE users (name text PRIMARY KEY, age int)")
+    session.execute(
+        "INSERT INTO users (name, age) VALUES (%s, %s)", ("O'Hara AND Co", 40)
+    )
+    session.execute("INSERT INTO users (name, age) VALUES ('Bob', 30)")
+
+    rows = session.execute(
+        "SELECT name, age FROM users WHERE name = %s LIMIT %s",
+        ("O'Hara AND Co", 5),
+    ).all()
+
+    assert [(row.name, row.age) for row in rows] == [("O'Hara AND Co", 40)]
+
+
+@mock_scylladb
+def test_select_by_primary_key_in_list():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+    session.execute(
+        "CREATE KEYSPACE pk_keyspace WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("pk_keyspace")
+    session.execute(
+        "CREATE TABLE events (day int, seq int, kind text, PRIMARY KEY (day, seq))"
+    )
+    for day in range(4):
+        for seq in range(3):
+            session.execute(
+                "INSERT INTO events (day, seq, kind) VALUES (%s, %s, %s)",
+                (day, seq, f"{day}-{seq}"),
+            )
+
+    rows = session.execute(
+        "SELECT kind FROM events WHERE day IN (1, 3, 1, 9) AND seq = 2"
+    ).all()
+    assert sorted(row.kind for row in rows) == ["1-2", "3-2"]
+
+    count = session.execute(
+        "SELECT COUNT(*) FROM events WHERE day IN (0, 2) AND seq IN (0, 1)"
+    ).one()
+    assert count[0] == 4
+
+
+@mock_scylladb
+def test_select_by_key_after_the_key_column_was_updated():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+    session.execute(
+        "CREATE KEYSPACE ks WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("ks")
+    session.execute("CREATE TABLE t (id int PRIMARY KEY, v text)")
+    session.execute("INSERT INTO t (id, v) VALUES (1, 'a')")
+    session.execute("INSERT INTO t (id, v) VALUES (2, 'b')")
+
+    session.execute("UPDATE t SET id = 5 WHERE id = 1")
+
+    rows = session.execute("SELECT * FROM t WHERE id = 5").all()
+    assert [(row.id, row.v) for row in rows] == [(5, "a")]
+    count = session.execute("SELECT COUNT(*) FROM t WHERE id = 5").one()
+    assert count[0] == 1
+    rows = session.execute("SELECT v FROM t WHERE id IN (5, 2)").all()
+    assert sorted(row.v for row in rows) == ["a", "b"]
@@ -1,6 +1,7 @@
 from cassandra.cluster import Cluster
 
 from mockylla import mock_scylladb
+from mockylla.parser import parse
 
 
 def _bootstrap_schema(session):
@@ -47,6 +48,28 @@ def test_execute_async_returns_future():
     assert future.cancelled() is False
 
 
+@mock_scylladb
+def test_future_callbacks_receive_extra_arguments():
+    cluster = Cluster()
+    session = cluster.connect()
+    _bootstrap_schema(session)
+    session.execute("INSERT INTO users (id, name) VALUES (1, 'Alice')")
+
+    future = session.execute_async("SELECT name FROM users WHERE id = 1")
+
+    seen = []
+    future.add_callback(
+        lambda result, tag: seen.append((tag, result[0].name)), "a"
+    )
+    future.add_callbacks(
+        lambda result, tag: seen.append((tag, result[0].name)),
+        None,
+        callback_args=("b",),
+    )
+
+    assert seen == [("a", "Alice"), ("b", "Alice")]
+
+
 @mock_scylladb
 def test_session_attributes_exposed():
     cluster = Cluster()
@@ -59,3 +82,18 @@ def test_session_attributes_exposed():
 
     assert session.row_factory is not None
     assert session.default_timeout == 5
+
+
+@mock_scylladb
+def test_repeated_queries_reuse_compiled_statement():
+    cluster = Cluster()
+    session = cluster.connect()
+    _bootstrap_schema(session)
+
+    query = "INSERT INTO users (id, name) VALUES (%s, %s)"
+    session.execute(query, (1, "Alice"))
+    session.execute(query, (2, "Bob"))
+
+    assert parse(query) is parse(query)
+    rows = session.execute("SELECT name FROM users").all()
+    assert sorted(row.name for row in rows) == ["Alice", "Bob"]
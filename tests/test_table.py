@@ -35,3 +35,21 @@ def test_create_table():
     assert schema["user_id"] == "int"
     assert schema["name"] == "text"
     assert schema["email"] == "text"
+
+
+@mock_scylladb
+def test_table_info_keeps_only_its_definition_after_queries():
+    session = Cluster(["127.0.0.1"]).connect()
+    session.execute(
+        "CREATE KEYSPACE ks "
+        "WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.execute("CREATE TABLE ks.users (id int PRIMARY KEY, name text)")
+    table_info = get_tables("ks")["users"]
+    keys_before = set(table_info)
+
+    session.execute("INSERT INTO ks.users (id, name) VALUES (%s, %s)", (1, "a"))
+    session.execute("SELECT * FROM ks.users WHERE id = 1")
+    session.execute("DELETE FROM ks.users WHERE id = 1")
+
+    assert set(table_info) == keys_before
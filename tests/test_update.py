@@ -120,3 +120,143 @@ def test_update_if_condition():
         f"UPDATE {table_name} SET value = 50 WHERE id = 2 IF value = 10"
     )
     assert result_missing.one()["[applied]"] is False
+
+
+@mock_scylladb
+def test_update_by_composite_primary_key_touches_only_that_row():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+    session.execute(
+        "CREATE KEYSPACE ks WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("ks")
+    session.execute(
+        "CREATE TABLE events (user_id int, seq int, payload text, PRIMARY KEY (user_id, seq))"
+    )
+    for user_id in range(3):
+        for seq in range(3):
+            session.execute(
+                "INSERT INTO events (user_id, seq, payload) VALUES (%s, %s, %s)",
+                (user_id, seq, "old"),
+            )
+
+    session.execute(
+        "UPDATE events SET payload = %s WHERE user_id = %s AND seq = %s",
+        ("new", 1, 2),
+    )
+    session.execute(
+        "UPDATE events SET payload = 'created' WHERE user_id = 9 AND seq = 0"
+    )
+
+    rows = get_table_rows("ks", "events")
+    payloads = {(row["user_id"], row["seq"]): row["payload"] for row in rows}
+    assert payloads.pop((1, 2)) == "new"
+    assert payloads.pop((9, 0)) == "created"
+    assert set(payloads.values()) == {"old"}
+    assert len(payloads) == 8
+
+
+@mock_scylladb
+def test_back_to_back_writes_get_increasing_writetimes():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+    session.execute(
+        "CREATE KEYSPACE ks WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("ks")
+    session.execute("CREATE TABLE users (id int PRIMARY KEY, name text)")
+
+    writetimes = []
+    for index in range(20):
+        session.execute(
+            "UPDATE users SET name = %s WHERE id = 1", (f"name{index}",)
+        )
+        row = session.execute(
+            "SELECT name, WRITETIME(name) AS wt FROM users WHERE id = 1"
+        ).one()
+        writetimes.append(row.wt)
+
+    assert row.name == "name19"
+    assert writetimes == sorted(set(writetimes))
+
+
+@mock_scylladb
+def test_update_set_values_containing_commas():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+    session.execute(
+        "CREATE KEYSPACE ks WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("ks")
+    session.execute(
+        "CREATE TABLE users (id int PRIMARY KEY, name text, tags list<text>)"
+    )
+
+    session.execute(
+        "UPDATE users SET name = 'Doe, Jane', tags = ['a', 'b'] WHERE id = 1"
+    )
+
+    row = session.execute("SELECT name, tags FROM users WHERE id = 1").one()
+    assert row.name == "Doe, Jane"
+    assert row.tags == ["a", "b"]
+
+
+@mock_scylladb
+def test_update_binds_parameters_without_reparsing_their_text():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+    session.execute(
+        "CREATE KEYSPACE ks WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("ks")
+    session.execute(
+        "CREATE TABLE users (id int PRIMARY KEY, name text, score int)"
+    )
+    session.execute("INSERT INTO users (id, name, score) VALUES (1, 'a', 1)")
+
+    session.execute(
+        "UPDATE users SET name = %s, score = %s WHERE id = %s",
+        ("O'Brien AND Sons, Ltd", "7", 1),
+    )
+
+    row = session.execute("SELECT name, score FROM users WHERE id = 1").one()
+    assert row.name == "O'Brien AND Sons, Ltd"
+    assert row.score == 7
+
+
+@mock_scylladb
+def test_update_of_key_column_is_visible_to_key_lookups():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+    session.execute(
+        "CREATE KEYSPACE ks WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("ks")
+    session.execute("CREATE TABLE t (id int PRIMARY KEY, v text)")
+    session.execute("INSERT INTO t (id, v) VALUES (1, 'a')")
+    assert session.execute("SELECT v FROM t WHERE id = 1").one().v == "a"
+
+    session.execute("UPDATE t SET id = 5 WHERE id = 1")
+
+    assert session.execute("SELECT v FROM t WHERE id = 5").one().v == "a"
+    assert session.execute("SELECT v FROM t WHERE id = 1").all() == []
+
+
+@mock_scylladb
+def test_key_lookups_see_rows_changed_through_get_table_rows():
+    cluster = Cluster(["127.0.0.1"])
+    session = cluster.connect()
+    session.execute(
+        "CREATE KEYSPACE ks WITH REPLICATION = {'class': 'SimpleStrategy', 'replication_factor': 1}"
+    )
+    session.set_keyspace("ks")
+    session.execute("CREATE TABLE t (id int PRIMARY KEY, v text)")
+    session.execute("INSERT INTO t (id, v) VALUES (1, 'a')")
+
+    (row,) = get_table_rows("ks", "t")
+    assert session.execute("SELECT v FROM t WHERE id = 1").one().v == "a"
+    row["id"] = 5
+
+    assert session.execute("SELECT v FROM t WHERE id = 5").one().v == "a"
+    session.execute("UPDATE t SET v = 'b' WHERE id = 5")
+    assert [r["v"] for r in get_table_rows("ks", "t")] == ["b"]